@@ -54,7 +54,8 @@ class DualCaptureRequest(BaseModel):
 	project_name: str
 	resolution: str = "medium"
 	include_resolution_in_filename: bool = False
-	stagger_ms: int = 20
+	stagger_ms: Optional[int] = None  # None = calibrated per camera pair
+	sync: bool = False  # Use libcamera software sync (left camera = server) instead of stagger
 	record_id: Optional[int] = None  # Link to existing record, or create new if None
 	record_title: Optional[str] = None  # Used if creating new record
 	sequence: Optional[int] = None  # Page number/order
@@ -135,6 +136,13 @@ def list_camera_devices(current_user: User = Depends(allow_read_only)):
 	if registry is None:
 		return []
 
+	# A fresh device scan is the natural point to pick up hotplugged cameras
+	try:
+		from capture.service import refresh_cameras
+		refresh_cameras()
+	except ImportError:
+		pass
+
 	try:
 		detected = registry.detect_cameras()
 		devices = []
@@ -380,7 +388,7 @@ def trigger_capture(
 	Creates or links to existing Record, then creates RecordImage with capture manifest linkage.
 	"""
 	try:
-		from capture.service import single_capture_image, is_camera_connected
+		from capture.service import single_capture_image, verify_cameras
 		from capture.camera import CameraConfig, IMG_SIZES
 		from capture.project_manager import default_camera_config_from_registry
 		from PIL import Image
@@ -390,8 +398,10 @@ def trigger_capture(
 	except ImportError as e:
 		return CaptureResponse(success=False, error=f"Capture system not available: {e}")
 	
-	# Validate camera is connected
-	if not is_camera_connected(request.camera_index):
+	# Validate camera is connected; the token lets the capture skip re-checking
+	try:
+		verification_token = verify_cameras(request.camera_index)
+	except RuntimeError:
 		return CaptureResponse(
 			success=False, 
 			error=f"Camera {request.camera_index} is not connected"
@@ -416,7 +426,7 @@ def trigger_capture(
 		output_path, capture_id, pair_id = single_capture_image(
 			project_name=request.project_name,
 			camera_config=camera_config,
-			check_camera=False,  # Already checked
+			verification_token=verification_token,  # Already checked
 			include_resolution=request.include_resolution_in_filename,
 			collection_name=collection_name
 		)
@@ -550,7 +560,7 @@ def trigger_dual_capture(
 	Creates or links to existing Record, then creates two linked RecordImages.
 	"""
 	try:
-		from capture.service import dual_capture_image, is_camera_connected
+		from capture.service import dual_capture_image, verify_cameras
 		from capture.camera import CameraConfig
 		from capture.project_manager import default_camera_config_from_registry
 		from PIL import Image
@@ -561,19 +571,24 @@ def trigger_dual_capture(
 	except ImportError as e:
 		return CaptureResponse(success=False, error=f"Capture system not available: {e}")
 	
-	# Validate both cameras are connected
-	for idx in [0, 1]:
-		if not is_camera_connected(idx):
-			return CaptureResponse(
-				success=False,
-				error=f"Camera {idx} is not connected"
-			)
+	# Validate both cameras are connected (one listing for the pair)
+	try:
+		verification_token = verify_cameras(0, 1)
+	except RuntimeError as e:
+		return CaptureResponse(
+			success=False,
+			error=str(e).rstrip(".")
+		)
 	
 	try:
 		# Get configs from registry with calibration
 		config0_dict, _ = default_camera_config_from_registry(0, request.resolution)
 		config1_dict, _ = default_camera_config_from_registry(1, request.resolution)
 		
+		if request.sync:
+			config0_dict["sync_role"] = "server" if request.left_camera_index == 0 else "client"
+			config1_dict["sync_role"] = "client" if request.left_camera_index == 0 else "server"
+		
 		cam0_config = CameraConfig(**config0_dict)
 		cam1_config = CameraConfig(**config1_dict)
 		
@@ -589,7 +604,7 @@ def trigger_dual_capture(
 			project_name=request.project_name,
 			cam1_config=cam0_config,
 			cam2_config=cam1_config,
-			check_camera=False,
+			verification_token=verification_token,
 			include_resolution=request.include_resolution_in_filename,
 			stagger_ms=request.stagger_ms,
 			collection_name=collection_name
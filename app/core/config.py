@@ -13,8 +13,22 @@ class Settings(BaseSettings):
     PROJECTS_ROOT: str = Field(default="", env="PROJECTS_ROOT")
     EXPORTS_ROOT: str = Field(default="", env="DTK_EXPORTS_DIR")
     CAMERA_BACKEND: str = Field(default="picamera2", env="CAMERA_BACKEND")
+    # Remember created capture directories per process; set to false if
+    # project folders may be deleted while the service is running
+    CAPTURE_DIR_MEMO: bool = Field(default=True, env="CAPTURE_DIR_MEMO")
+    # Comma-separated CPU cores to pin capture worker threads to, e.g. "2,3" (empty = no pinning)
+    CAPTURE_CPU_CORES: str = Field(default="", env="CAPTURE_CPU_CORES")
+    # JPEG quality of captures made through the API. 93 is the archival
+    # default; 85 encodes noticeably faster and smaller on the Pi
+    CAPTURE_JPEG_QUALITY: int = Field(default=93, env="CAPTURE_JPEG_QUALITY")
+    # Content hash stored for captured files in the manifest: "sha256", or
+    # "blake3" (several times faster on the Pi, needs the blake3 package)
+    MANIFEST_HASH: str = Field(default="sha256", env="MANIFEST_HASH")
     SECRET_KEY: str = Field(default="dev-secret-change-me", env="SECRET_KEY")
     ACCESS_TOKEN_EXPIRE_SECONDS: int = Field(default=28800, env="ACCESS_TOKEN_EXPIRE_SECONDS")  # 8 hours
+    # PBKDF2 iterations for new password hashes. The test suite lowers this
+    # to keep auth fixtures fast; existing hashes record their own count
+    PASSWORD_HASH_ITERATIONS: int = Field(default=100_000, env="PASSWORD_HASH_ITERATIONS")
     app_version: str = "0.0.0-dev"
 
     model_config = ConfigDict(
@@ -1,5 +1,5 @@
 import json
-import time
+from time import time as _now
 import hmac
 import hashlib
 import base64
@@ -12,6 +12,11 @@ from app.core.config import settings
 SECRET_KEY = settings.SECRET_KEY
 DEFAULT_EXPIRE_SECONDS = settings.ACCESS_TOKEN_EXPIRE_SECONDS
 
+# Iteration count of hashes stored as "salt$hash"; hashes made with any other
+# count are stored as "iterations$salt$hash"
+LEGACY_PASSWORD_ITERATIONS = 100_000
+PASSWORD_HASH_ITERATIONS = settings.PASSWORD_HASH_ITERATIONS
+
 
 def _b64u_encode(data: bytes) -> str:
     return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
@@ -24,17 +29,29 @@ def _b64u_decode(data: str) -> bytes:
 
 def hash_password(password: str) -> str:
     salt = secrets.token_hex(16)
-    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 100_000)
-    return f"{salt}${dk.hex()}"
+    iterations = PASSWORD_HASH_ITERATIONS
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), iterations)
+    if iterations == LEGACY_PASSWORD_ITERATIONS:
+        return f"{salt}${dk.hex()}"
+    return f"{iterations}${salt}${dk.hex()}"
 
 
 def verify_password(password: str, hashed: str) -> bool:
     try:
-        salt, hash_hex = hashed.split("$", 1)
+        parts = hashed.split("$")
+        if len(parts) == 2:
+            iterations = LEGACY_PASSWORD_ITERATIONS
+            salt, hash_hex = parts
+        else:
+            iterations_str, salt, hash_hex = parts
+            iterations = int(iterations_str)
     except Exception:
         return False
-    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), 100_000)
-    return hmac.compare_digest(dk.hex(), hash_hex)
+    if iterations < 1:
+        return False
+    dk = hashlib.pbkdf2_hmac("sha256", password.encode("utf-8"), salt.encode("utf-8"), iterations)
+    # Compare bytes: compare_digest rejects str with non-ASCII characters
+    return hmac.compare_digest(dk.hex().encode("ascii"), hash_hex.encode("utf-8"))
 
 
 def create_access_token(subject: str, expires_seconds: Optional[int] = None) -> str:
@@ -42,7 +59,7 @@ def create_access_token(subject: str, expires_seconds: Optional[int] = None) ->
         expires_seconds = DEFAULT_EXPIRE_SECONDS
     payload = {
         "sub": str(subject),
-        "exp": int(time.time()) + int(expires_seconds),
+        "exp": int(_now()) + int(expires_seconds),
     }
     payload_b = json.dumps(payload, separators=(",", ":")).encode("utf-8")
     payload_enc = _b64u_encode(payload_b)
@@ -59,7 +76,7 @@ def verify_access_token(token: str) -> Optional[dict]:
             return None
         payload_b = _b64u_decode(payload_enc)
         payload = json.loads(payload_b)
-        if payload.get("exp", 0) < int(time.time()):
+        if payload.get("exp", 0) < int(_now()):
             return None
         return payload
     except Exception:
@@ -4,12 +4,17 @@ Thumbnail generation utilities for record images.
 This module provides functions for generating and managing thumbnails of record images.
 """
 
+import io
 import logging
 from pathlib import Path
-from typing import Optional
-from PIL import Image
+from typing import TYPE_CHECKING, Optional
 import uuid
 
+# PIL is imported where thumbnails are made, so importing the API routers
+# (app startup, route tests) doesn't load it
+if TYPE_CHECKING:
+    from PIL import Image
+
 logger = logging.getLogger(__name__)
 
 # Default thumbnail dimensions
@@ -19,6 +24,43 @@ DEFAULT_THUMBNAIL_FORMAT = "JPEG"
 DEFAULT_THUMBNAIL_QUALITY = 85
 
 
+# IFD1 tags locating the embedded JPEG thumbnail inside the EXIF block
+_EXIF_THUMB_OFFSET = 0x0201  # JPEGInterchangeFormat
+_EXIF_THUMB_LENGTH = 0x0202  # JPEGInterchangeFormatLength
+
+
+def _embedded_thumbnail(img: "Image.Image", max_width: int, max_height: int) -> Optional["Image.Image"]:
+    """
+    Return the EXIF thumbnail of a JPEG if it can stand in for the full image.
+    
+    Captures taken with ``--thumb`` carry a small JPEG in EXIF IFD1; scaling
+    that down avoids decoding the full-resolution frame. It is only used when
+    it covers the requested box and has the same aspect ratio as the image.
+    """
+    from PIL import Image, ExifTags
+    
+    exif_bytes = img.info.get("exif")
+    if not exif_bytes:
+        return None
+    try:
+        ifd1 = img.getexif().get_ifd(ExifTags.IFD.IFD1)
+        offset, length = ifd1.get(_EXIF_THUMB_OFFSET), ifd1.get(_EXIF_THUMB_LENGTH)
+        if not offset or not length:
+            return None
+        # Offsets count from the TIFF header, which follows the b"Exif\0\0" marker
+        start = 6 + offset
+        thumb = Image.open(io.BytesIO(exif_bytes[start:start + length]))
+        thumb.load()
+    except Exception:
+        return None
+    
+    if thumb.width < max_width and thumb.height < max_height:
+        return None
+    if abs(thumb.width * img.height - thumb.height * img.width) > 0.02 * img.width * thumb.height:
+        return None
+    return thumb
+
+
 def generate_thumbnail(
     source_path: Path,
     dest_dir: Path,
@@ -47,6 +89,8 @@ def generate_thumbnail(
     
     dest_dir.mkdir(parents=True, exist_ok=True)
     
+    from PIL import Image
+    
     try:
         # Open the image
         with Image.open(source_path) as img:
@@ -57,6 +101,12 @@ def generate_thumbnail(
                 rgb_img.paste(img, mask=img.split()[-1] if img.mode in ("RGBA", "LA") else None)
                 img = rgb_img
             
+            # Prefer the embedded EXIF thumbnail over decoding the full frame.
+            # Otherwise thumbnail() uses draft() so libjpeg decodes at a DCT
+            # scale (1/2..1/8) instead of full size.
+            if img.format == "JPEG":
+                img = _embedded_thumbnail(img, max_width, max_height) or img
+            
             # Calculate thumbnail size maintaining aspect ratio
             img.thumbnail((max_width, max_height), Image.Resampling.LANCZOS)
             
@@ -1,3 +1,5 @@
+import asyncio
+import logging
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from contextlib import asynccontextmanager
@@ -13,10 +15,54 @@ from app.api.collections import router as collections_router
 from app.api.auth import router as auth_router, users_router
 from app.api.system import router as system_router
 
-# Define lifespan event to initialize the database
+logger = logging.getLogger(__name__)
+
+
+def _discover_cameras():
+    """
+    Probe cameras once so capture requests don't run a probe each time, then
+    prewarm them with the default capture settings so the first capture
+    doesn't pay for configuring and starting the camera. Camera pairs without
+    a calibrated start stagger are calibrated here rather than on their first
+    dual capture.
+    """
+    try:
+        from capture.service import startup_camera_discovery, prewarm_cameras, calibrate_missing_staggers
+        from capture.camera import CameraConfig
+        from capture.project_manager import default_camera_config_from_registry
+    except ImportError as e:
+        logger.info(f"Capture system not available, skipping camera discovery: {e}")
+        return
+    try:
+        cameras = startup_camera_discovery()
+    except Exception as e:
+        logger.warning(f"Camera discovery failed: {e}")
+        return
+    try:
+        # "medium" is the default resolution of the capture endpoints
+        configs = [
+            CameraConfig(**default_camera_config_from_registry(index, "medium")[0])
+            for index in sorted(cameras or ())
+        ]
+        prewarm_cameras(*configs)
+    except Exception as e:
+        logger.warning(f"Camera prewarm failed: {e}")
+        return
+    try:
+        calibrate_missing_staggers(*configs)
+    except Exception as e:
+        logger.warning(f"Stagger calibration failed: {e}")
+
+
+# Define lifespan event to initialize the database and discover cameras
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     init_db()
+    # Discovery, prewarm and stagger calibration take real captures (minutes
+    # with a faulty camera), so run them on a worker thread in the background;
+    # until they finish, captures probe cameras on demand and use the
+    # default stagger. Kept on app.state so the task isn't garbage collected.
+    app.state.camera_discovery = asyncio.create_task(asyncio.to_thread(_discover_cameras))
     yield
 
 # Create FastAPI app with lifespan
@@ -44,3 +90,10 @@ app.include_router(system_router, prefix="/system", tags=["system"])
 @app.get("/health")
 def health():
     return {"status": "ok"}
+
+
+# Every registered route path, for cheap route lookups (tests, validate_system)
+# without walking app.routes each time
+app.state.path_index = frozenset(
+    route.path for route in app.routes if hasattr(route, "path")
+)
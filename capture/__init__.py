@@ -4,23 +4,42 @@ DTK Capture Module
 Provides camera capture services with multiple backend support.
 """
 
-from .camera import CameraConfig
+from .camera import CameraConfig, CameraConfigs
 from .service import (
     is_camera_connected,
+    invalidate_camera_cache,
+    refresh_cameras,
+    verify_cameras,
+    prewarm_cameras,
     capture_image,
+    capture_image_deferred,
     single_capture_image,
     dual_capture_image,
+    capture_batch,
+    capture_image_async,
+    dual_capture_image_async,
     get_backend,
     get_camera_backend,
 )
+from .stream import CaptureStream
 from .backends import CameraBackend, RpicamBackend, Picamera2Backend
 
 __all__ = [
     'CameraConfig',
+    'CameraConfigs',
     'is_camera_connected',
+    'invalidate_camera_cache',
+    'refresh_cameras',
+    'verify_cameras',
+    'prewarm_cameras',
     'capture_image',
+    'capture_image_deferred',
     'single_capture_image',
     'dual_capture_image',
+    'capture_batch',
+    'capture_image_async',
+    'dual_capture_image_async',
+    'CaptureStream',
     'get_backend',
     'get_camera_backend',
     'CameraBackend',
@@ -7,7 +7,7 @@ between implementations.
 """
 
 from .base import CameraBackend
-from .subprocess_backend import RpicamBackend
+from .subprocess_backend import RpicamBackend, RpicamSignalBackend
 from .picamera2_backend import Picamera2Backend
 
-__all__ = ['CameraBackend', 'RpicamBackend', 'Picamera2Backend']
+__all__ = ['CameraBackend', 'RpicamBackend', 'RpicamSignalBackend', 'Picamera2Backend']
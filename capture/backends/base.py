@@ -4,6 +4,10 @@ Abstract base class for camera backends.
 Defines the interface that all camera backend implementations must follow.
 """
 
+import asyncio
+import concurrent.futures
+import threading
+import time
 from abc import ABC, abstractmethod
 from typing import Optional
 from pathlib import Path
@@ -39,6 +43,16 @@ class CameraBackend(ABC):
         """
         pass
     
+    def list_cameras(self) -> Optional[set]:
+        """
+        Return the indices of all connected cameras from a single probe.
+        
+        Returns:
+            set: Connected camera indices, or None if this backend cannot
+                list cameras in one call (callers then probe per index).
+        """
+        return None
+    
     @abstractmethod
     def capture_image(
         self,
@@ -62,6 +76,99 @@ class CameraBackend(ABC):
         """
         pass
     
+    async def capture_image_async(
+        self,
+        output_path: Path,
+        camera_config,
+        capture_output: bool = False
+    ):
+        """
+        Capture a single image without blocking the event loop.
+        
+        The default implementation runs ``capture_image`` in a worker
+        thread; backends that can await the capture natively override it.
+        Arguments and return value are the same as ``capture_image``.
+        """
+        return await asyncio.to_thread(self.capture_image, output_path, camera_config, capture_output)
+    
+    def prewarm(self, camera_config) -> None:
+        """
+        Get a camera ready to capture with *camera_config* without capturing.
+        
+        Backends that keep cameras running override this; the default does
+        nothing (e.g. each rpicam-still call starts the camera itself).
+        """
+        pass
+    
+    def capture_image_deferred(self, output_path: Path, camera_config):
+        """
+        Capture a single image but leave the disk write pending.
+        
+        The default implementation captures synchronously and returns an
+        already completed future; backends that encode/write off-thread
+        override it so the caller can start the next shot while the
+        previous image is still being saved.
+        
+        Returns:
+            tuple: (output_path, metadata, write_future). ``write_future``
+                resolves to the final path(s) once the file is on disk, or
+                raises if saving failed.
+        """
+        future = concurrent.futures.Future()
+        result = self.capture_image(output_path, camera_config)
+        if isinstance(result, tuple) and len(result) == 2 and not isinstance(result[1], str):
+            path, metadata = result  # (path_or_paths, metadata)
+        else:
+            path, metadata = result, None
+        future.set_result(path)
+        return path, metadata, future
+    
+    def capture_images(self, jobs, stagger_ms: int = 0) -> list:
+        """
+        Capture several images at once, one per (output_path, camera_config) job.
+        
+        The default implementation runs ``capture_image`` for every job on
+        its own thread; thread ``i`` sleeps ``i * stagger_ms`` before
+        capturing. Backends that can drive all cameras from one thread
+        override it.
+        
+        Args:
+            jobs: List of (output_path, camera_config) tuples.
+            stagger_ms (int): Delay in ms between consecutive camera starts.
+            
+        Returns:
+            list: (``capture_image`` result, seconds the capture took) for
+                each job, in job order; the stagger sleep is not included.
+            
+        Raises:
+            RuntimeError: If any capture fails (after all have finished).
+        """
+        results = [None] * len(jobs)
+        errors = []
+        
+        def run(i, output_path, camera_config):
+            if i and stagger_ms > 0:
+                time.sleep(i * stagger_ms / 1000.0)
+            start = time.monotonic_ns()
+            try:
+                results[i] = (
+                    self.capture_image(output_path, camera_config),
+                    (time.monotonic_ns() - start) / 1e9,
+                )
+            except Exception as e:
+                errors.append(e)
+        
+        threads = []
+        for i, (output_path, camera_config) in enumerate(jobs):
+            thread = threading.Thread(target=run, args=(i, output_path, camera_config))
+            thread.start()
+            threads.append(thread)
+        for thread in threads:
+            thread.join()
+        if errors:
+            raise errors[0]
+        return results
+    
     @abstractmethod
     def supports_streaming(self) -> bool:
         """
@@ -8,13 +8,21 @@ live preview, and dynamic settings adjustment.
 
 import sys
 import time
+import atexit
 import threading
+import concurrent.futures
 from pathlib import Path
+from typing import Optional
 
-# Only import picamera2/libcamera on Linux (inside Docker/Raspberry Pi)
+# Only import picamera2/libcamera on Linux (inside Docker/Raspberry Pi).
+# A Linux host without the system packages falls back like other platforms.
 if sys.platform == "linux":
-    from picamera2 import Picamera2
-    from libcamera import Transform
+    try:
+        from picamera2 import Picamera2
+        from libcamera import Transform
+    except ImportError:
+        Picamera2 = None
+        Transform = None
 else:
     Picamera2 = None
     Transform = None
@@ -23,6 +31,19 @@ else:
 
 from .base import CameraBackend
 
+# Encoding (JPEG/PNG) and writing captured images runs on these threads, so a
+# camera is released as soon as its frame has been copied out of the request
+# and can serve the next preview/capture while the previous image is saved.
+# Four workers: a dual capture with raw enabled queues four writes at once.
+_writer_pool = concurrent.futures.ThreadPoolExecutor(max_workers=4, thread_name_prefix="writer")
+atexit.register(_writer_pool.shutdown)
+
+
+def _write_buffer(path: Path, buffer) -> None:
+    """Write a copied-out sensor buffer to *path* (writer thread)."""
+    with open(path, 'wb') as f:
+        f.write(buffer)
+
 
 class Picamera2Backend(CameraBackend):
     """
@@ -48,7 +69,7 @@ class Picamera2Backend(CameraBackend):
             logger: Logger instance for logging operations.
         """
         if Picamera2 is None:
-            raise RuntimeError("Picamera2Backend requires Linux (Raspberry Pi OS)")
+            raise RuntimeError("Picamera2Backend requires Linux (Raspberry Pi OS) with picamera2 installed")
         
         super().__init__(logger)
         self._cameras = {}  # Cache of initialized Picamera2 instances
@@ -58,6 +79,10 @@ class Picamera2Backend(CameraBackend):
         # Per-camera mutex: serialises preview polling and full captures so they
         # never call capture_request() on the same Picamera2 instance simultaneously.
         self._camera_locks: dict = {}
+        # Per-camera save locks: picamera2 reads the JPEG quality from the
+        # shared picam2.options at save time, so saves of one camera must not
+        # interleave on the writer threads.
+        self._save_locks: dict = {}
         self._locks_mutex = threading.Lock()
     
     def _get_camera_lock(self, camera_index: int) -> threading.Lock:
@@ -67,6 +92,19 @@ class Picamera2Backend(CameraBackend):
                 self._camera_locks[camera_index] = threading.Lock()
             return self._camera_locks[camera_index]
 
+    def _get_save_lock(self, camera_index: int) -> threading.Lock:
+        """Return (creating if needed) the per-camera lock for image saves."""
+        with self._locks_mutex:
+            if camera_index not in self._save_locks:
+                self._save_locks[camera_index] = threading.Lock()
+            return self._save_locks[camera_index]
+
+    def _save_image(self, camera_index: int, picam2, image, metadata: dict, path: str, quality: int) -> None:
+        """Encode and write *image* with picamera2's EXIF-aware saver (writer thread)."""
+        with self._get_save_lock(camera_index):
+            picam2.options["quality"] = quality
+            picam2.helpers.save(image, metadata, path)
+
     def _get_camera_info(self):
         """Get global camera information (cached)."""
         if self._camera_info is None:
@@ -86,7 +124,7 @@ class Picamera2Backend(CameraBackend):
             Picamera2: The camera instance.
         """
         if camera_index not in self._cameras:
-            self.logger.info(f"Initializing Picamera2 for camera {camera_index}")
+            self.logger.info("Initializing Picamera2 for camera %s", camera_index)
             try:
                 picam2 = Picamera2(camera_index)
                 self._cameras[camera_index] = picam2
@@ -109,7 +147,7 @@ class Picamera2Backend(CameraBackend):
         try:
             cameras = self._get_camera_info()
             if camera_index < len(cameras):
-                self.logger.info(f"Camera {camera_index} is connected: {cameras[camera_index].get('Model', 'Unknown')}")
+                self.logger.info("Camera %s is connected: %s", camera_index, cameras[camera_index].get('Model', 'Unknown'))
                 return True
             else:
                 self.logger.warning(f"Camera {camera_index} not found (only {len(cameras)} camera(s) detected)")
@@ -118,6 +156,19 @@ class Picamera2Backend(CameraBackend):
             self.logger.error(f"Failed to detect cameras: {e}")
             return False
     
+    def list_cameras(self) -> Optional[set]:
+        """
+        Return the indices of all cameras known to libcamera.
+        
+        Returns:
+            set: Connected camera indices, or None if detection failed.
+        """
+        try:
+            return set(range(len(self._get_camera_info())))
+        except Exception as e:
+            self.logger.error(f"Failed to detect cameras: {e}")
+            return None
+    
     def _config_to_picamera2_controls(self, camera_config):
         """
         Convert CameraConfig to Picamera2 control parameters.
@@ -151,6 +202,11 @@ class Picamera2Backend(CameraBackend):
         else:
             controls["AfMode"] = 0  # Manual focus
         
+        # Software camera sync (rpi::SyncMode): 1 = server, 2 = client
+        sync_map = {"server": 1, "client": 2}
+        if camera_config.sync_role in sync_map:
+            controls["SyncMode"] = sync_map[camera_config.sync_role]
+        
         return controls
     
     def _extract_archival_metadata(self, metadata: dict) -> dict:
@@ -225,126 +281,220 @@ class Picamera2Backend(CameraBackend):
         Raises:
             RuntimeError: If capture fails.
         """
+        output_path, archival_metadata, pending = self.capture_image_deferred(output_path, camera_config)
+        output_path = pending.result()
+        self.logger.debug("Image captured successfully: %s", output_path)
+        return output_path, archival_metadata
+
+    def capture_image_deferred(self, output_path: Path, camera_config) -> tuple:
+        """
+        Capture a single image and return before it is encoded and written.
+        
+        The camera is released as soon as the frame is copied out of the
+        request, so back-to-back callers can expose the next frame while the
+        writer pool is still encoding this one.
+        
+        Args:
+            output_path (Path): Full path where the image should be saved.
+            camera_config: CameraConfig object with capture settings.
+            
+        Returns:
+            tuple: (output_path, metadata, write_future). ``write_future``
+                resolves to the saved path(s) (the raw path is dropped if
+                only the raw write failed).
+            
+        Raises:
+            RuntimeError: If capture fails (write errors are raised by
+                ``write_future.result()``).
+        """
         lock = self._get_camera_lock(camera_config.camera_index)
         with lock:
-            return self._capture_image_locked(output_path, camera_config, capture_output)
+            output_path, archival_metadata, pending_save, pending_raw = self._capture_image_locked(
+                output_path, camera_config
+            )
+        
+        done = concurrent.futures.Future()
+        remaining = [pending_save] if pending_raw is None else [pending_save, pending_raw]
+        remaining_lock = threading.Lock()
+        
+        def finish(_):
+            with remaining_lock:
+                remaining.pop()
+                if remaining:
+                    return
+            # Both writes finished; resolve from the writer thread that ended last
+            try:
+                pending_save.result()
+            except Exception as e:
+                self.logger.error(f"Failed to save image: {e}")
+                done.set_exception(RuntimeError(f"Picamera2 capture failed: {e}"))
+                return
+            result = output_path
+            if pending_raw is not None:
+                try:
+                    pending_raw.result()
+                    self.logger.debug("Saved raw buffer: %s", Path(output_path[1]).name)
+                except Exception as e:
+                    self.logger.warning(f"Failed to save raw buffer: {e}, continuing with JPEG only")
+                    result = output_path[0]
+            done.set_result(result)
+        
+        for future in list(remaining):
+            future.add_done_callback(finish)
+        return output_path, archival_metadata, done
+
+    def _prepare_camera_locked(self, camera_config):
+        """
+        Configure (if settings changed) and start a camera; camera lock must be held.
+        
+        Runs the temporal denoise warmup after a reconfigure, so once this
+        has returned a capture only waits for AF/AE and the next frame.
+        
+        Returns:
+            The started Picamera2 instance.
+        """
+        picam2 = self._get_camera(camera_config.camera_index)
+        
+        # Determine if we need to reconfigure
+        # For now, we'll configure each time to ensure settings match
+        # In future optimization, we could cache configurations
+        
+        # Use YUV420 format for JPEG captures (faster, less memory)
+        # Use RGB888 for PNG or when raw/DNG is needed
+        use_yuv = camera_config.encoding in ["jpg", "jpeg"] and not camera_config.raw
+        
+        # Create still configuration with transform if needed
+        config_args = {
+            "main": {
+                "size": camera_config.img_size,
+                "format": "YUV420" if use_yuv else "RGB888"
+            },
+            "buffer_count": camera_config.buffer_count,
+        }
+        
+        # Add raw stream if DNG capture requested
+        if camera_config.raw:
+            config_args["raw"] = {}  # Enable raw stream for DNG
+        
+        # Apply transformations (flip)
+        if camera_config.hflip or camera_config.vflip:
+            if Transform is None:
+                raise RuntimeError("Transform requires Linux")
+            hflip = 1 if camera_config.hflip else 0
+            vflip = 1 if camera_config.vflip else 0
+            config_args["transform"] = Transform(hflip=hflip, vflip=vflip)
+        
+        still_config = picam2.create_still_configuration(**config_args)
+        
+        # Check if camera is already running with the same config
+        # Only reconfigure if settings changed - this preserves AE/AF state
+        last_config = self._last_configs.get(camera_config.camera_index)
+        last_format = self._format_mode.get(camera_config.camera_index)
+        needs_reconfigure = (
+            last_config is None or
+            last_format != use_yuv or
+            last_config.img_size != camera_config.img_size or
+            last_config.hflip != camera_config.hflip or
+            last_config.vflip != camera_config.vflip or
+            last_config.buffer_count != camera_config.buffer_count
+        )
+        
+        if needs_reconfigure:
+            if picam2.started:
+                self.logger.debug("Stopping camera %s to reconfigure", camera_config.camera_index)
+                picam2.stop()
+            
+            picam2.configure(still_config)
+            self.logger.debug("Camera %s configured: %s, format=%s", camera_config.camera_index, camera_config.img_size, 'YUV420' if use_yuv else 'RGB888')
+            self._last_configs[camera_config.camera_index] = camera_config
+            self._format_mode[camera_config.camera_index] = use_yuv
+        else:
+            self.logger.debug("Camera %s using cached configuration", camera_config.camera_index)
+        
+        # Apply controls
+        controls = self._config_to_picamera2_controls(camera_config)
+        
+        # Start camera if not already running
+        if not picam2.started:
+            picam2.start()
+            self.logger.debug("Camera %s started", camera_config.camera_index)
+        
+        # Apply controls after start
+        if controls:
+            picam2.set_controls(controls)
+        
+        # Manual focus if lens position specified
+        if hasattr(camera_config, 'lens_position') and camera_config.lens_position is not None:
+            self.logger.debug("Setting manual focus: LensPosition=%s", camera_config.lens_position)
+            picam2.set_controls({"LensPosition": camera_config.lens_position})
+        
+        # Temporal denoise warmup (Pi 5 feature)
+        # Skip frames after camera start to let temporal denoise algorithm build history
+        # This produces cleaner images with better noise reduction
+        if hasattr(camera_config, 'denoise_frames') and camera_config.denoise_frames > 0 and needs_reconfigure:
+            # Only apply warmup if we just reconfigured (camera was stopped/restarted)
+            # Calculate delay: assuming ~30fps, each frame is ~33ms
+            warmup_delay = camera_config.denoise_frames * 0.033
+            self.logger.debug("Temporal denoise warmup: skipping %s frames (%.2fs)", camera_config.denoise_frames, warmup_delay)
+            time.sleep(warmup_delay)
+        
+        return picam2
+
+    def prewarm(self, camera_config) -> None:
+        """
+        Configure and start a camera ahead of its first capture.
+        
+        The camera then keeps streaming, so the first capture with these
+        settings skips configure, start and denoise warmup and takes the
+        next frame from the running pipeline.
+        
+        Raises:
+            RuntimeError: If the camera cannot be opened or configured.
+        """
+        with self._get_camera_lock(camera_config.camera_index):
+            try:
+                self._prepare_camera_locked(camera_config)
+            except Exception as e:
+                self.logger.error(f"Failed to prewarm camera {camera_config.camera_index}: {e}")
+                raise RuntimeError(f"Picamera2 prewarm failed: {e}")
+        self.logger.debug("Camera %s prewarmed", camera_config.camera_index)
 
     def _capture_image_locked(
         self,
         output_path: Path,
         camera_config,
         capture_output: bool = False
-    ) -> str:
-        """Internal capture implementation — must be called with the camera lock held."""
+    ) -> tuple:
+        """
+        Internal capture implementation — must be called with the camera lock held.
+        
+        Returns (output_path, archival_metadata, pending_save, pending_raw)
+        where the last two are the writer-pool futures of the main image and
+        raw buffer saves (pending_raw is None without raw capture).
+        """
         try:
-            picam2 = self._get_camera(camera_config.camera_index)
-            
-            # Determine if we need to reconfigure
-            # For now, we'll configure each time to ensure settings match
-            # In future optimization, we could cache configurations
-            
-            # Use YUV420 format for JPEG captures (faster, less memory)
-            # Use RGB888 for PNG or when raw/DNG is needed
-            use_yuv = camera_config.encoding in ["jpg", "jpeg"] and not camera_config.raw
-            
-            # Create still configuration with transform if needed
-            config_args = {
-                "main": {
-                    "size": camera_config.img_size,
-                    "format": "YUV420" if use_yuv else "RGB888"
-                },
-                "buffer_count": camera_config.buffer_count,
-            }
-            
-            # Add raw stream if DNG capture requested
-            if camera_config.raw:
-                config_args["raw"] = {}  # Enable raw stream for DNG
-            
-            # Apply transformations (flip)
-            if camera_config.hflip or camera_config.vflip:
-                if Transform is None:
-                    raise RuntimeError("Transform requires Linux")
-                hflip = 1 if camera_config.hflip else 0
-                vflip = 1 if camera_config.vflip else 0
-                config_args["transform"] = Transform(hflip=hflip, vflip=vflip)
-            
-            still_config = picam2.create_still_configuration(**config_args)
-            
-            # Check if camera is already running with the same config
-            # Only reconfigure if settings changed - this preserves AE/AF state
-            last_config = self._last_configs.get(camera_config.camera_index)
-            last_format = self._format_mode.get(camera_config.camera_index)
-            needs_reconfigure = (
-                last_config is None or
-                last_format != use_yuv or
-                last_config.img_size != camera_config.img_size or
-                last_config.hflip != camera_config.hflip or
-                last_config.vflip != camera_config.vflip or
-                last_config.buffer_count != camera_config.buffer_count
-            )
-            
-            if needs_reconfigure:
-                if picam2.started:
-                    self.logger.debug(f"Stopping camera {camera_config.camera_index} to reconfigure")
-                    picam2.stop()
-                
-                picam2.configure(still_config)
-                self.logger.debug(f"Camera {camera_config.camera_index} configured: {camera_config.img_size}, format={'YUV420' if use_yuv else 'RGB888'}")
-                self._last_configs[camera_config.camera_index] = camera_config
-                self._format_mode[camera_config.camera_index] = use_yuv
-            else:
-                self.logger.debug(f"Camera {camera_config.camera_index} using cached configuration")
-            
-            # Apply controls
-            controls = self._config_to_picamera2_controls(camera_config)
-            
-            # Start camera if not already running
-            if not picam2.started:
-                picam2.start()
-                self.logger.debug(f"Camera {camera_config.camera_index} started")
-            
-            # Set JPEG quality via options (applies to capture_file)
-            picam2.options["quality"] = camera_config.quality
-            
-            # Apply controls after start
-            if controls:
-                picam2.set_controls(controls)
-            
-            # Manual focus if lens position specified
-            if hasattr(camera_config, 'lens_position') and camera_config.lens_position is not None:
-                self.logger.debug(f"Setting manual focus: LensPosition={camera_config.lens_position}")
-                picam2.set_controls({"LensPosition": camera_config.lens_position})
-            
-            # Temporal denoise warmup (Pi 5 feature)
-            # Skip frames after camera start to let temporal denoise algorithm build history
-            # This produces cleaner images with better noise reduction
-            if hasattr(camera_config, 'denoise_frames') and camera_config.denoise_frames > 0 and needs_reconfigure:
-                # Only apply warmup if we just reconfigured (camera was stopped/restarted)
-                # Calculate delay: assuming ~30fps, each frame is ~33ms
-                warmup_delay = camera_config.denoise_frames * 0.033
-                self.logger.debug(f"Temporal denoise warmup: skipping {camera_config.denoise_frames} frames ({warmup_delay:.2f}s)")
-                time.sleep(warmup_delay)
+            picam2 = self._prepare_camera_locked(camera_config)
             
             # Trigger autofocus cycle if enabled
             # This ensures sharp images by focusing before capture
             if camera_config.autofocus_on_capture:
-                self.logger.debug(f"Triggering autofocus for camera {camera_config.camera_index}")
+                self.logger.debug("Triggering autofocus for camera %s", camera_config.camera_index)
                 success = picam2.autofocus_cycle()
                 if success:
-                    self.logger.debug(f"Autofocus succeeded")
+                    self.logger.debug("Autofocus succeeded")
                 else:
                     self.logger.warning(f"Autofocus failed for camera {camera_config.camera_index}")
             
             # Wait for auto-exposure to stabilize
             # Timeout allows AE to converge for proper exposure
             if camera_config.timeout > 0:
-                self.logger.debug(f"Waiting {camera_config.timeout}ms for AE stabilization")
+                self.logger.debug("Waiting %sms for AE stabilization", camera_config.timeout)
                 time.sleep(camera_config.timeout / 1000.0)
             
             # Capture image directly to file with metadata
             # YUV420→JPEG is done efficiently by libcamera/picamera2
             # No manual PIL conversion needed
-            self.logger.info(f"Capturing image to: {output_path}")
+            self.logger.debug("Capturing image to: %s", output_path)
 
             # Reset ScalerCrop to full sensor — zoom is preview-only.
             # Ensures captures always use the full pixel array regardless of
@@ -355,12 +505,26 @@ class Picamera2Backend(CameraBackend):
                     {"ScalerCrop": (0, 0, _pixel_array_size[0], _pixel_array_size[1])}
                 )
 
-            # Use request-based capture to get metadata and save files
-            request = picam2.capture_request()
+            # Use request-based capture to get metadata and save files.
+            # In sync mode wait for the first frame flagged SyncReady so both
+            # cameras return frames from the same frame boundary.
+            if camera_config.sync_role and hasattr(picam2, "capture_sync_request"):
+                request = picam2.capture_sync_request()
+            else:
+                request = picam2.capture_request()
             try:
                 # Extract metadata first
                 metadata = request.get_metadata()
                 
+                # Copy the main stream out of the camera buffer; encoding and
+                # the disk write happen on the writer pool after release.
+                main_image = request.make_image("main")
+                pending_save = _writer_pool.submit(
+                    self._save_image, camera_config.camera_index, picam2,
+                    main_image, metadata, str(output_path), camera_config.quality
+                )
+                pending_raw = None
+                
                 if camera_config.raw:
                     # Multi-format capture: save both JPEG and raw buffer
                     # Raw buffer contains full sensor data for archival preservation
@@ -369,41 +533,34 @@ class Picamera2Backend(CameraBackend):
                     # Generate raw filename (.raw extension for now due to picamera2 DNG bug)
                     raw_path = Path(str(output_path).rsplit('.', 1)[0] + '.raw')
                     
-                    # Save JPEG first
-                    request.save("main", str(output_path))
-                    self.logger.debug(f"Saved JPEG: {Path(output_path).name}")
-                    
                     # Save raw buffer directly (workaround for picamera2 save_dng bug)
                     # picamera2 0.3.33 has a bug: Picamera2Camera.__init__() signature mismatch
                     # Saving raw sensor data as binary until library is fixed
+                    # make_buffer copies out of the request, so the write can
+                    # run on the writer pool alongside the JPEG encode
                     try:
                         raw_buffer = request.make_buffer("raw")
-                        with open(raw_path, 'wb') as f:
-                            f.write(raw_buffer)
-                        self.logger.debug(f"Saved raw buffer: {raw_path.name}")
+                        pending_raw = _writer_pool.submit(_write_buffer, raw_path, raw_buffer)
                         output_path = (str(output_path), str(raw_path))
                     except Exception as e:
                         self.logger.warning(f"Failed to save raw buffer: {e}, continuing with JPEG only")
                         output_path = str(output_path)
                 else:
-                    # Standard JPEG/PNG capture only
-                    request.save("main", str(output_path))
-                    self.logger.debug(f"Saved {'JPEG' if use_yuv else 'PNG'} with quality={camera_config.quality}")
+                    self.logger.debug("Queued %s save with quality=%s", camera_config.encoding.upper(), camera_config.quality)
                     
             finally:
                 request.release()
             
             # Extract relevant metadata for archival documentation
             archival_metadata = self._extract_archival_metadata(metadata)
-            self.logger.debug(f"Captured metadata: {archival_metadata}")
-            
-            self.logger.info(f"Image captured successfully: {output_path}")
+            self.logger.debug("Captured metadata: %s", archival_metadata)
             
             # Note: We keep the camera running for better performance on next capture
             # It will be stopped/reconfigured if settings change or in cleanup()
             
-            # Return path (can be string or tuple for multi-format) and metadata
-            return output_path, archival_metadata
+            # Return path (can be string or tuple for multi-format), metadata
+            # and the pending main image and raw buffer saves
+            return output_path, archival_metadata, pending_save, pending_raw
             
         except Exception as e:
             self.logger.error(f"Failed to capture image: {e}")
@@ -454,7 +611,7 @@ class Picamera2Backend(CameraBackend):
                 if picam2.started:
                     picam2.stop()
                 picam2.close()
-                self.logger.info(f"Reset camera {camera_index} (evicted from cache)")
+                self.logger.info("Reset camera %s (evicted from cache)", camera_index)
             except Exception as e:
                 self.logger.warning(f"Error while resetting camera {camera_index}: {e}")
 
@@ -642,12 +799,12 @@ class Picamera2Backend(CameraBackend):
         picam2 = self._cameras.get(camera_index)
         if picam2 is None:
             self.logger.debug(
-                f"apply_zoom: camera {camera_index} not yet open, skipping"
+                "apply_zoom: camera %s not yet open, skipping", camera_index
             )
             return
         if not picam2.started:
             self.logger.debug(
-                f"apply_zoom: camera {camera_index} not started, skipping"
+                "apply_zoom: camera %s not started, skipping", camera_index
             )
             return
 
@@ -667,8 +824,8 @@ class Picamera2Backend(CameraBackend):
         try:
             picam2.set_controls({"ScalerCrop": (crop_x, crop_y, crop_w, crop_h)})
             self.logger.debug(
-                f"Camera {camera_index} zoom {zoom:.1f}x: "
-                f"ScalerCrop=({crop_x},{crop_y},{crop_w},{crop_h})"
+                "Camera %s zoom %.1fx: ScalerCrop=(%s,%s,%s,%s)",
+                camera_index, zoom, crop_x, crop_y, crop_w, crop_h
             )
         except Exception as e:
             self.logger.warning(
@@ -692,17 +849,17 @@ class Picamera2Backend(CameraBackend):
         picam2 = self._cameras.get(camera_index)
         if picam2 is None:
             self.logger.debug(
-                f"apply_controls: camera {camera_index} not yet open, skipping"
+                "apply_controls: camera %s not yet open, skipping", camera_index
             )
             return
         if not picam2.started:
             self.logger.debug(
-                f"apply_controls: camera {camera_index} not started, skipping"
+                "apply_controls: camera %s not started, skipping", camera_index
             )
             return
         try:
             picam2.set_controls(controls)
-            self.logger.debug(f"Applied controls to camera {camera_index}: {controls}")
+            self.logger.debug("Applied controls to camera %s: %s", camera_index, controls)
         except Exception as e:
             self.logger.warning(f"Failed to apply controls to camera {camera_index}: {e}")
 
@@ -718,7 +875,7 @@ class Picamera2Backend(CameraBackend):
                 if picam2.started:
                     picam2.stop()
                 picam2.close()
-                self.logger.debug(f"Closed camera {camera_index}")
+                self.logger.debug("Closed camera %s", camera_index)
             except Exception as e:
                 self.logger.warning(f"Error closing camera {camera_index}: {e}")
         
@@ -2,13 +2,165 @@
 Subprocess-based camera backend using rpicam-still.
 """
 
+import asyncio
+import atexit
+import functools
+import logging
+import os
+import select
+import shutil
+import signal
 import subprocess
+import tempfile
+import threading
+import time
 from pathlib import Path
 from typing import Optional
 
 from .base import CameraBackend
 
 
+# Debug captures keep at most this much of each output stream: the tail,
+# which is where libcamera reports why a capture failed.
+_MAX_CAPTURED_OUTPUT = 64 * 1024
+
+
+def _drain_stream(stream, sink: bytearray) -> None:
+    """Read *stream* until EOF into *sink*, keeping only the last _MAX_CAPTURED_OUTPUT bytes."""
+    for chunk in iter(lambda: stream.read1(65536), b""):
+        sink += chunk
+        if len(sink) > _MAX_CAPTURED_OUTPUT:
+            del sink[:-_MAX_CAPTURED_OUTPUT]
+
+
+# Fast-path captures are started with posix_spawn: a single vfork/exec on
+# Linux, without subprocess's fork_exec bookkeeping.
+_USE_POSIX_SPAWN = hasattr(os, "posix_spawnp")
+
+# Keyword arguments that let subprocess.Popen take its own posix_spawn path
+# instead of fork+exec (it needs close_fds=False and an executable with a
+# directory component). Python's own descriptors are non-inheritable
+# (PEP 446), so not closing fds leaks nothing into the child.
+_SPAWN_KWARGS = {"close_fds": False}
+
+
+@functools.lru_cache(maxsize=1)
+def _rpicam_still() -> str:
+    """Absolute path of rpicam-still (resolved once), or the bare name if not on PATH."""
+    return shutil.which("rpicam-still") or "rpicam-still"
+
+# Send the child's stdout/stderr to /dev/null by duplicating one descriptor
+# opened here once, rather than opening /dev/null twice in every child. The
+# parent's copy is close-on-exec, so only fds 1 and 2 reach rpicam-still.
+if _USE_POSIX_SPAWN:
+    _DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+    _DEVNULL_FILE_ACTIONS = (
+        (os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 1),
+        (os.POSIX_SPAWN_DUP2, _DEVNULL_FD, 2),
+    )
+else:
+    _DEVNULL_FILE_ACTIONS = ()
+
+
+# Process-exit notification through pidfds (Linux 5.3+): one epoll wait
+# covers every child, with no wake-ups until one of them exits.
+_USE_PIDFD = hasattr(os, "pidfd_open") and hasattr(select, "epoll")
+
+
+def _spawn(command) -> int:
+    """Start rpicam-still with *command* as argv and output discarded; return its pid."""
+    return os.posix_spawnp(_rpicam_still(), command, os.environ, file_actions=_DEVNULL_FILE_ACTIONS)
+
+
+def _wait_many(pids, timeout: float) -> dict:
+    """
+    Wait for all *pids* to exit, killing any still running after *timeout* seconds.
+    
+    Returns:
+        dict: pid -> (exit code, time.monotonic_ns() when it was reaped). The
+            exit code is None for children killed on timeout. Without pidfd
+            children are reaped in order, so a fast child's time is only an
+            upper bound.
+    """
+    results = {}
+    if _USE_PIDFD:
+        epoll = select.epoll()
+        pidfds = {}
+        try:
+            for pid in pids:
+                try:
+                    fd = os.pidfd_open(pid)
+                except OSError:  # e.g. kernel without pidfd support
+                    _, status = os.waitpid(pid, 0)
+                    results[pid] = (os.waitstatus_to_exitcode(status), time.monotonic_ns())
+                    continue
+                pidfds[fd] = pid
+                epoll.register(fd, select.EPOLLIN)
+            deadline = time.monotonic() + timeout
+            while len(results) < len(pids):
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for fd, _ in epoll.poll(remaining):
+                    epoll.unregister(fd)
+                    pid = pidfds[fd]
+                    _, status = os.waitpid(pid, 0)
+                    results[pid] = (os.waitstatus_to_exitcode(status), time.monotonic_ns())
+        finally:
+            for fd in pidfds:
+                os.close(fd)
+            epoll.close()
+        for pid in pids:
+            if pid not in results:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                results[pid] = (None, time.monotonic_ns())
+        return results
+
+    # Fallback: blocking waitpid per child, with one watchdog killing
+    # whatever is still running at the deadline
+    pending = set(pids)
+    killed = set()
+    lock = threading.Lock()
+
+    def kill_pending():
+        with lock:
+            for pid in pending:
+                # Children that already exited (not yet reaped) keep their status
+                if os.waitid(os.P_PID, pid, os.WEXITED | os.WNOHANG | os.WNOWAIT) is not None:
+                    continue
+                os.kill(pid, signal.SIGKILL)
+                killed.add(pid)
+
+    watchdog = threading.Timer(timeout, kill_pending)
+    watchdog.start()
+    try:
+        for pid in pids:
+            _, status = os.waitpid(pid, 0)
+            exited = time.monotonic_ns()
+            with lock:
+                pending.discard(pid)
+            results[pid] = (None if pid in killed else os.waitstatus_to_exitcode(status), exited)
+    finally:
+        watchdog.cancel()
+    return results
+
+
+def _spawn_and_wait(command, timeout: float) -> int:
+    """
+    Run *command* with output discarded and return its exit code.
+    
+    Raises:
+        subprocess.TimeoutExpired: If it runs longer than *timeout* seconds
+            (the child is killed and reaped first).
+    """
+    pid = _spawn(command)
+    returncode, _ = _wait_many((pid,), timeout)[pid]
+    if returncode is None:
+        raise subprocess.TimeoutExpired(command, timeout)
+    return returncode
+
+
 class RpicamBackend(CameraBackend):
     """
     Camera backend using rpicam-still subprocess calls.
@@ -37,26 +189,79 @@ class RpicamBackend(CameraBackend):
             "rpicam-still",
             "--list-cameras"
         ]
+        # Stream the listing and stop as soon as the camera's header line
+        # ("<index> : <model> ...") appears; the per-mode details that follow
+        # are never needed here.
+        prefix = f"{camera_index} :"
         try:
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command,
-                check=True,
-                capture_output=True,
+                executable=_rpicam_still(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=4096,
                 text=True,
-                timeout=5 
+                **_SPAWN_KWARGS
             )
-            if f"{camera_index} :" in result.stdout:
-                self.logger.info(f"Camera {camera_index} is connected.")
-                return True
-            else:
-                self.logger.warning(f"Camera {camera_index} not found in available cameras.")
+        except OSError as e:
+            self.logger.error(f"Failed to list cameras: {e}")
+            return False
+        # Reading stdout blocks, so enforce the 5s limit with a watchdog
+        watchdog = threading.Timer(5, proc.kill)
+        watchdog.start()
+        try:
+            for line in proc.stdout:
+                if line.startswith(prefix):
+                    self.logger.info("Camera %s is connected.", camera_index)
+                    return True
+            returncode = proc.wait()
+            if returncode == -signal.SIGKILL:
+                self.logger.error("Camera list check timed out.")
                 return False
-        except subprocess.CalledProcessError as e:
-            self.logger.error(f"Failed to list cameras: {e.stderr}")
+            if returncode != 0:
+                self.logger.error(f"Failed to list cameras (exit code: {returncode})")
+                return False
+            self.logger.warning(f"Camera {camera_index} not found in available cameras.")
             return False
+        finally:
+            watchdog.cancel()
+            if proc.poll() is None:
+                proc.terminate()
+            proc.stdout.close()
+            proc.wait()
+    
+    def list_cameras(self) -> Optional[set]:
+        """
+        Return the indices of all cameras in one --list-cameras run.
+        
+        Returns:
+            set: Connected camera indices, or None if the listing failed.
+        """
+        try:
+            result = subprocess.run(
+                ["rpicam-still", "--list-cameras"],
+                executable=_rpicam_still(),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=5,
+                **_SPAWN_KWARGS
+            )
         except subprocess.TimeoutExpired:
             self.logger.error("Camera list check timed out.")
-            return False
+            return None
+        except OSError as e:
+            self.logger.error(f"Failed to list cameras: {e}")
+            return None
+        if result.returncode != 0:
+            self.logger.error(f"Failed to list cameras (exit code: {result.returncode})")
+            return None
+        # Camera header lines look like "<index> : <model> ..."
+        return {
+            int(line.split(" :", 1)[0])
+            for line in result.stdout.splitlines()
+            if " :" in line and line.split(" :", 1)[0].isdigit()
+        }
     
     def capture_image(
         self,
@@ -78,52 +283,64 @@ class RpicamBackend(CameraBackend):
         Raises:
             RuntimeError: If capture fails.
         """
-        command = [
-            "rpicam-still",
-            "-o", str(output_path),
-            "--width", str(camera_config.img_size[0]),
-            "--height", str(camera_config.img_size[1]),
-            "--quality", str(camera_config.quality),
-            "--awb", camera_config.awb,
-            "--buffer-count", str(camera_config.buffer_count),
-            "--camera", str(camera_config.camera_index)
-        ]
+        command = (*camera_config._cached_cmd, "-o", str(output_path))
         
-        if camera_config.timeout == 0:
-            command.append("--immediate")
-        else:
-            command.extend(["-t", str(camera_config.timeout)])
-        if camera_config.nopreview:
-            command.append("-n")
-        if camera_config.vflip:
-            command.append("--vflip")
-        if camera_config.hflip:
-            command.append("--hflip")
-        if camera_config.autofocus_on_capture:
-            command.append("--autofocus-on-capture")
-        if camera_config.thumbnail:
-            command.extend(["--thumb", "320:240:70"])
-        if camera_config.zsl:
-            command.append("--zsl")
-        # Manual focus via lens position (optional float, in dioptres)
-        lens_pos = getattr(camera_config, "lens_position", None)
-        if lens_pos is not None:
-            command.extend(["--lens-position", str(lens_pos)])
-        if camera_config.encoding != "jpg":
-            command.extend(["--encoding", camera_config.encoding])
-        if camera_config.raw:
-            command.append("--raw")
-        
-        self.logger.info("Executing command: %s", ' '.join(command))
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing command: %s", ' '.join(command))
         try:
-            result = subprocess.run(
-                command,
-                check=True,
-                capture_output=capture_output,
-                text=capture_output,
-                timeout=10
-            )
-            self.logger.info(f"Image captured successfully: {output_path}")
+            if capture_output:
+                # Debug mode: keep both streams (libcamera logs verbosely to
+                # stderr). Drainer threads empty the pipes while the child
+                # runs so a full 64 KiB pipe buffer can never stall it.
+                proc = subprocess.Popen(
+                    command,
+                    executable=_rpicam_still(),
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    bufsize=65536,
+                    **_SPAWN_KWARGS
+                )
+                stdout_buf, stderr_buf = bytearray(), bytearray()
+                drainers = [
+                    threading.Thread(target=_drain_stream, args=(proc.stdout, stdout_buf), daemon=True),
+                    threading.Thread(target=_drain_stream, args=(proc.stderr, stderr_buf), daemon=True),
+                ]
+                for drainer in drainers:
+                    drainer.start()
+                try:
+                    proc.wait(timeout=10)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+                    proc.wait()
+                    raise
+                finally:
+                    for drainer in drainers:
+                        drainer.join()
+                    proc.stdout.close()
+                    proc.stderr.close()
+                if proc.returncode != 0:
+                    raise subprocess.CalledProcessError(
+                        proc.returncode, command,
+                        output=stdout_buf.decode("utf-8", errors="replace"),
+                        stderr=stderr_buf.decode("utf-8", errors="replace")
+                    )
+            elif _USE_POSIX_SPAWN:
+                # Fast path: discard rpicam-still's output so it never writes
+                # to the service's terminal/journal or fills a pipe
+                returncode = _spawn_and_wait(command, timeout=10)
+                if returncode != 0:
+                    raise subprocess.CalledProcessError(returncode, command)
+            else:
+                subprocess.run(
+                    command,
+                    executable=_rpicam_still(),
+                    check=True,
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=10,
+                    **_SPAWN_KWARGS
+                )
+            self.logger.debug("Image captured successfully: %s", output_path)
             return str(output_path)
         except subprocess.CalledProcessError as e:
             if capture_output:
@@ -135,6 +352,109 @@ class RpicamBackend(CameraBackend):
             self.logger.error(f"Image capture timed out after 10s")
             raise RuntimeError("Image capture timed out")
     
+    def capture_images(self, jobs, stagger_ms: int = 0) -> list:
+        """
+        Capture with several cameras from the calling thread.
+        
+        One rpicam-still is spawned per job (``stagger_ms`` apart) and all of
+        them are reaped by a single ``_wait_many``, so no thread per camera
+        sits waiting on its child.
+        
+        Args:
+            jobs: List of (output_path, camera_config) tuples.
+            stagger_ms (int): Delay in ms between consecutive camera starts.
+            
+        Returns:
+            list: (output path string, seconds from spawn to exit) per job,
+                in job order.
+            
+        Raises:
+            RuntimeError: If any capture fails or times out.
+        """
+        if not _USE_POSIX_SPAWN:
+            return super().capture_images(jobs, stagger_ms)
+        
+        commands = [
+            (*camera_config._cached_cmd, "-o", str(output_path))
+            for output_path, camera_config in jobs
+        ]
+        pids = []
+        started = []
+        try:
+            for i, command in enumerate(commands):
+                if i and stagger_ms > 0:
+                    time.sleep(stagger_ms / 1000.0)
+                if self.logger.isEnabledFor(logging.DEBUG):
+                    self.logger.debug("Executing command: %s", ' '.join(command))
+                started.append(time.monotonic_ns())
+                pids.append(_spawn(command))
+        finally:
+            # Reap whatever was started, even if a later spawn failed
+            exits = _wait_many(pids, timeout=10)
+        
+        results = []
+        for pid, start, (output_path, camera_config) in zip(pids, started, jobs):
+            returncode, exited = exits[pid]
+            if returncode is None:
+                self.logger.error(f"Image capture timed out after 10s (camera {camera_config.camera_index})")
+                raise RuntimeError("Image capture timed out")
+            if returncode != 0:
+                self.logger.error(f"Error capturing image (exit code: {returncode})")
+                raise RuntimeError(f"Failed to capture image: camera {camera_config.camera_index} exited with code {returncode}")
+            results.append((str(output_path), (exited - start) / 1e9))
+        
+        self.logger.debug("Images captured successfully: %s", [str(path) for path, _ in jobs])
+        return results
+    
+    async def capture_image_async(
+        self,
+        output_path: Path,
+        camera_config,
+        capture_output: bool = False
+    ) -> str:
+        """
+        Capture an image with rpicam-still, awaiting the process on the event loop.
+        
+        No thread is held while rpicam-still runs, so many captures can be
+        in flight at once.
+        
+        Args:
+            output_path (Path): Full path where the image should be saved.
+            camera_config: CameraConfig object with all capture settings.
+            capture_output (bool): Capture stderr for debugging (default is False for performance).
+            
+        Returns:
+            str: The path to the captured image file.
+            
+        Raises:
+            RuntimeError: If capture fails.
+        """
+        command = (*camera_config._cached_cmd, "-o", str(output_path))
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing command: %s", ' '.join(command))
+        proc = await asyncio.create_subprocess_exec(
+            _rpicam_still(), *command[1:],
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE if capture_output else asyncio.subprocess.DEVNULL,
+            **_SPAWN_KWARGS
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=10)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            self.logger.error(f"Image capture timed out after 10s")
+            raise RuntimeError("Image capture timed out")
+        if proc.returncode != 0:
+            if capture_output:
+                self.logger.error(f"Error capturing image: {stderr.decode('utf-8', errors='replace')}")
+            else:
+                self.logger.error(f"Error capturing image (exit code: {proc.returncode})")
+            raise RuntimeError(f"Failed to capture image: rpicam-still exited with code {proc.returncode}")
+        self.logger.debug("Image captured successfully: %s", output_path)
+        return str(output_path)
+    
     def supports_streaming(self) -> bool:
         """
         Check if this backend supports video streaming/preview.
@@ -161,3 +481,201 @@ class RpicamBackend(CameraBackend):
             str: "rpicam-subprocess"
         """
         return "rpicam-subprocess"
+
+
+class RpicamSignalBackend(RpicamBackend):
+    """
+    rpicam-still backend that keeps one long-running process per camera.
+    
+    Each camera runs ``rpicam-still -t 0 --signal`` and takes a shot whenever
+    it receives SIGUSR1, so the camera stack and tuning file are loaded once
+    instead of on every capture. Frames land in a per-camera spool directory
+    and are moved to the requested output path. rpicam-still numbers the
+    frames from 0, so the n-th capture of a daemon waits for ``cap_<n>``
+    (and its ``.dng`` sibling with ``raw``) rather than for any file.
+    
+    The daemon is (re)started when a capture asks for different settings
+    than the running process was started with.
+    """
+
+    # Interval between checks for the spooled frame
+    POLL_INTERVAL = 0.005
+    # rpicam-still only installs its SIGUSR1 handler once the camera is
+    # running; an earlier signal would terminate it
+    STARTUP_DELAY = 1.0
+
+    def __init__(self, logger):
+        super().__init__(logger)
+        self._daemons = {}  # camera_index -> (Popen, cmd, spool_dir)
+        self._frame_counts = {}  # camera_index -> frames requested from the daemon
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+        atexit.register(self.cleanup)
+
+    def _get_lock(self, camera_index: int) -> threading.Lock:
+        with self._locks_lock:
+            lock = self._locks.get(camera_index)
+            if lock is None:
+                lock = self._locks[camera_index] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def _daemon_command(camera_config, spool_dir: Path) -> tuple:
+        """Turn the config's rpicam-still argv into a signal-triggered one."""
+        cmd = list(camera_config._cached_cmd)
+        if "--immediate" in cmd:
+            cmd.remove("--immediate")
+        elif "-t" in cmd:
+            i = cmd.index("-t")
+            del cmd[i:i + 2]
+        extension = camera_config.encoding.lstrip(".")
+        return (*cmd, "-t", "0", "--signal", "-o", str(spool_dir / f"cap_%04d.{extension}"))
+
+    def _get_daemon(self, camera_config):
+        """Return the running daemon for the config's camera, starting it if needed."""
+        camera_index = camera_config.camera_index
+        daemon = self._daemons.get(camera_index)
+        if daemon is not None:
+            proc, cmd, spool_dir = daemon
+            if proc.poll() is None and self._daemon_command(camera_config, spool_dir) == cmd:
+                return daemon
+            self._stop_daemon(camera_index)
+
+        spool_dir = Path(tempfile.mkdtemp(prefix=f"rpicam-c{camera_index}-"))
+        cmd = self._daemon_command(camera_config, spool_dir)
+        self.logger.info("Starting rpicam-still signal daemon for camera %s", camera_index)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Executing command: %s", ' '.join(cmd))
+        proc = subprocess.Popen(
+            cmd, executable=_rpicam_still(),
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, **_SPAWN_KWARGS
+        )
+        daemon = self._daemons[camera_index] = (proc, cmd, spool_dir)
+        self._frame_counts[camera_index] = 0
+        try:
+            proc.wait(timeout=self.STARTUP_DELAY)
+        except subprocess.TimeoutExpired:
+            return daemon
+        self._stop_daemon(camera_index)
+        raise RuntimeError(f"rpicam-still daemon exited on startup (exit code: {proc.returncode})")
+
+    def _stop_daemon(self, camera_index: int) -> None:
+        daemon = self._daemons.pop(camera_index, None)
+        self._frame_counts.pop(camera_index, None)
+        if daemon is None:
+            return
+        proc, _, spool_dir = daemon
+        if proc.poll() is None:
+            proc.terminate()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+        shutil.rmtree(spool_dir, ignore_errors=True)
+
+    def _wait_for_frame(self, proc, frame: Path, jpeg: bool, deadline: float) -> None:
+        """
+        Wait until the daemon has finished writing *frame*.
+        
+        A frame counts as complete once its size stops changing between two
+        polls (and, for JPEG, it ends with the EOI marker).
+        
+        Raises:
+            TimeoutError: If the frame is not complete by *deadline*
+                (a time.monotonic() value).
+        """
+        last_size = -1
+        while time.monotonic() < deadline:
+            if proc.poll() is not None:
+                raise RuntimeError(f"rpicam-still daemon exited (exit code: {proc.returncode})")
+            try:
+                size = frame.stat().st_size
+            except FileNotFoundError:
+                size = -1
+            if size > 0 and size == last_size:
+                if not jpeg:
+                    return
+                with open(frame, "rb") as f:
+                    f.seek(-2, os.SEEK_END)
+                    if f.read(2) == b"\xff\xd9":
+                        return
+            last_size = size
+            time.sleep(self.POLL_INTERVAL)
+        raise TimeoutError
+
+    def capture_image(
+        self,
+        output_path: Path,
+        camera_config,
+        capture_output: bool = False
+    ) -> str:
+        """
+        Capture an image by signalling the camera's rpicam-still daemon.
+        
+        Args:
+            output_path (Path): Full path where the image should be saved.
+            camera_config: CameraConfig object with all capture settings.
+            capture_output (bool): Run a one-off rpicam-still with output
+                captured instead (debugging; bypasses the daemon).
+            
+        Returns:
+            str: The path to the captured image file.
+            
+        Raises:
+            RuntimeError: If capture fails.
+        """
+        if capture_output:
+            return super().capture_image(output_path, camera_config, capture_output)
+
+        camera_index = camera_config.camera_index
+        extension = camera_config.encoding.lstrip(".")
+        with self._get_lock(camera_index):
+            try:
+                proc, _, spool_dir = self._get_daemon(camera_config)
+                frame_number = self._frame_counts[camera_index]
+                self._frame_counts[camera_index] = frame_number + 1
+                frame = spool_dir / f"cap_{frame_number:04d}.{extension}"
+                proc.send_signal(signal.SIGUSR1)
+                deadline = time.monotonic() + 10
+                self._wait_for_frame(proc, frame, extension in ("jpg", "jpeg"), deadline)
+                if camera_config.raw:
+                    self._wait_for_frame(proc, frame.with_suffix(".dng"), False, deadline)
+            except TimeoutError:
+                self.logger.error(f"Image capture timed out after 10s")
+                self._stop_daemon(camera_index)
+                raise RuntimeError("Image capture timed out")
+            except RuntimeError as e:
+                self.logger.error(f"Error capturing image: {e}")
+                self._stop_daemon(camera_index)
+                raise RuntimeError(f"Failed to capture image: {e}")
+            # Rename when the spool and the project share a filesystem, copy otherwise
+            shutil.move(str(frame), str(output_path))
+            if camera_config.raw:
+                # Where a one-off rpicam-still --raw would have written it
+                shutil.move(str(frame.with_suffix(".dng")), str(Path(output_path).with_suffix(".dng")))
+            # Nothing of this frame may be left for a later capture to pick up
+            for leftover in spool_dir.glob(f"{frame.stem}.*"):
+                leftover.unlink(missing_ok=True)
+
+        self.logger.debug("Image captured successfully: %s", output_path)
+        return str(output_path)
+
+    # Captures go through the shared daemon, so run them in a thread rather
+    # than spawning a one-off process like RpicamBackend does.
+    capture_image_async = CameraBackend.capture_image_async
+    capture_images = CameraBackend.capture_images
+
+    def get_backend_name(self) -> str:
+        """
+        Get a human-readable name for this backend.
+        
+        Returns:
+            str: "rpicam-signal"
+        """
+        return "rpicam-signal"
+
+    def cleanup(self):
+        """Stop all rpicam-still daemons and remove their spool directories."""
+        for camera_index in list(self._daemons):
+            self._stop_daemon(camera_index)
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, asdict
+import functools
 from typing import Optional, Tuple
 import logging
 
@@ -9,6 +10,10 @@ IMG_SIZES = {
     "high": (4624, 3472),     # 16 MP, ~420 DPI for A4, 474 pph - Special collections
 }
 
+# Roles for libcamera software camera synchronisation (rpicam-apps --sync).
+# The server drives the frame timing; clients lock their frame boundaries to it.
+SYNC_ROLES = (None, "server", "client")
+
 
 @dataclass
 class CameraConfig:
@@ -44,6 +49,34 @@ class CameraConfig:
     raw: bool = False  # Capture RAW alongside JPEG
     denoise_frames: int = 10  # Number of frames to skip for temporal denoise warmup (Pi 5 feature, 0 to disable)
     zsl: bool = False  # Zero shutter lag mode (enables faster captures, may affect exposure)
+    sync_role: Optional[str] = None  # libcamera software sync: "server", "client" or None (off)
+
+    def __post_init__(self):
+        if self.sync_role not in SYNC_ROLES:
+            raise ValueError(f"sync_role must be one of {SYNC_ROLES}, got {self.sync_role!r}")
+
+    @property
+    def flags_bitmask(self) -> int:
+        """Boolean options packed into an int (bit i = _FLAG_FIELDS[i])."""
+        return sum(1 << i for i, name in enumerate(_FLAG_FIELDS) if getattr(self, name))
+
+    @property
+    def _cached_cmd(self) -> Tuple[str, ...]:
+        """
+        rpicam-still argv for these settings, minus the "-o <path>" pair.
+        
+        Shared through a small LRU cache keyed by the settings, so configs
+        rebuilt per request (same settings, new object) reuse one template.
+        """
+        return _argv_template((
+            self.camera_index, tuple(self.img_size), self.quality, self.awb,
+            self.buffer_count, self.timeout, self.flags_bitmask,
+            self.lens_position, self.encoding, self.sync_role,
+        ))
+
+    def _build_rpicam_command(self) -> Tuple[str, ...]:
+        """Build the rpicam-still argument list (without output path) for this config."""
+        return CameraConfigs.from_configs([self]).build_commands()[0]
 
     def to_dict(self):
         """Convert to dictionary for logging/serialization."""
@@ -58,6 +91,130 @@ class CameraConfig:
         return f"CameraConfig(cam{self.camera_index}, {self.img_size[0]}x{self.img_size[1]}, awb={self.awb})"
 
 
+# CameraConfig boolean fields in CameraConfigs.flags column order
+_FLAG_FIELDS = ("nopreview", "vflip", "hflip", "autofocus_on_capture", "thumbnail", "zsl", "raw")
+
+# rpicam-still arguments for CameraConfigs.flags, in column order. "raw" has
+# no entry: "--raw" goes after "--lens-position"/"--encoding", as it always has.
+_FLAG_ARGS = (
+    ("-n",),                            # nopreview
+    ("--vflip",),                       # vflip
+    ("--hflip",),                       # hflip
+    ("--autofocus-on-capture",),        # autofocus_on_capture
+    ("--thumb", "320:240:70"),          # thumbnail
+    ("--zsl",),                         # zsl
+)
+_RAW_FLAG = _FLAG_FIELDS.index("raw")
+
+
+@dataclass(frozen=True)
+class CameraConfigs:
+    """
+    Column-oriented view of several CameraConfigs for multi-camera rigs.
+    
+    Each field holds one value per camera, so command assembly and validation
+    are single passes over the columns instead of per-object attribute access.
+    Boolean options are packed per camera into ``flags`` (see ``_FLAG_ARGS``).
+    """
+    indices: Tuple[int, ...]
+    widths: Tuple[int, ...]
+    heights: Tuple[int, ...]
+    qualities: Tuple[int, ...]
+    awbs: Tuple[str, ...]
+    buffer_counts: Tuple[int, ...]
+    timeouts: Tuple[int, ...]
+    lens_positions: Tuple[Optional[float], ...]
+    encodings: Tuple[str, ...]
+    sync_roles: Tuple[Optional[str], ...]
+    flags: Tuple[Tuple[bool, ...], ...]  # [nopreview, vflip, hflip, af, thumbnail, zsl, raw]
+
+    @classmethod
+    def from_configs(cls, configs) -> "CameraConfigs":
+        """Transpose a sequence of CameraConfig objects into columns."""
+        return cls(
+            indices=tuple(c.camera_index for c in configs),
+            widths=tuple(c.img_size[0] for c in configs),
+            heights=tuple(c.img_size[1] for c in configs),
+            qualities=tuple(c.quality for c in configs),
+            awbs=tuple(c.awb for c in configs),
+            buffer_counts=tuple(c.buffer_count for c in configs),
+            timeouts=tuple(c.timeout for c in configs),
+            lens_positions=tuple(c.lens_position for c in configs),
+            encodings=tuple(c.encoding for c in configs),
+            sync_roles=tuple(c.sync_role for c in configs),
+            flags=tuple(tuple(getattr(c, name) for name in _FLAG_FIELDS) for c in configs),
+        )
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def validate(self) -> None:
+        """
+        Check the rig as a whole.
+        
+        Raises:
+            ValueError: If a camera index is used twice or more than one
+                camera is configured as sync server.
+        """
+        if len(set(self.indices)) != len(self.indices):
+            raise ValueError(f"Duplicate camera indices: {self.indices}")
+        if self.sync_roles.count("server") > 1:
+            raise ValueError("Only one camera can be the sync server")
+
+    def build_commands(self, output_paths=None) -> list:
+        """
+        Build the rpicam-still argv for every camera in one pass.
+        
+        Args:
+            output_paths: One output path per camera. If None, the
+                ``-o <path>`` pair is left out (command templates).
+        Returns:
+            list: One argv tuple per camera, in column order.
+        """
+        outputs = (
+            (("-o", str(p)) for p in output_paths)
+            if output_paths is not None else (() for _ in self.indices)
+        )
+        return [
+            (
+                "rpicam-still",
+                "--width", str(width),
+                "--height", str(height),
+                "--quality", str(quality),
+                "--awb", awb,
+                "--buffer-count", str(buffer_count),
+                "--camera", str(index),
+                *(("--immediate",) if timeout == 0 else ("-t", str(timeout))),
+                *(arg for flag, args in zip(flags, _FLAG_ARGS) if flag for arg in args),
+                # Manual focus via lens position (optional float, in dioptres)
+                *(("--lens-position", str(lens)) if lens is not None else ()),
+                *(("--encoding", encoding) if encoding != "jpg" else ()),
+                *(("--raw",) if flags[_RAW_FLAG] else ()),
+                # Software frame sync between cameras (server drives, client follows)
+                *(("--sync", sync_role) if sync_role else ()),
+                *output,
+            )
+            for index, width, height, quality, awb, buffer_count, timeout,
+                lens, encoding, sync_role, flags, output in zip(
+                self.indices, self.widths, self.heights, self.qualities, self.awbs,
+                self.buffer_counts, self.timeouts, self.lens_positions, self.encodings,
+                self.sync_roles, self.flags, outputs
+            )
+        ]
+
+
+@functools.lru_cache(maxsize=8)
+def _argv_template(key: tuple) -> Tuple[str, ...]:
+    """Build the rpicam-still argv (no output path) for a CameraConfig._cached_cmd key."""
+    index, (width, height), quality, awb, buffer_count, timeout, flags, lens, encoding, sync_role = key
+    return CameraConfigs(
+        indices=(index,), widths=(width,), heights=(height,), qualities=(quality,),
+        awbs=(awb,), buffer_counts=(buffer_count,), timeouts=(timeout,),
+        lens_positions=(lens,), encodings=(encoding,), sync_roles=(sync_role,),
+        flags=(tuple(bool(flags >> i & 1) for i in range(len(_FLAG_FIELDS))),),
+    ).build_commands()[0]
+
+
 # Helper functions for saving/loading camera configs
 def save_camera_configs(filepath: str, configs: dict):
     """
@@ -78,7 +235,7 @@ def save_camera_configs(filepath: str, configs: dict):
     data = {name: config.to_dict() for name, config in configs.items()}
     with open(filepath, 'w') as f:
         json.dump(data, f, indent=2)
-    subprocess_logger.info(f"Saved camera configs to {filepath}")
+    subprocess_logger.info("Saved camera configs to %s", filepath)
 
 
 def load_camera_configs(filepath: str) -> dict:
@@ -103,5 +260,5 @@ def load_camera_configs(filepath: str) -> dict:
     with open(filepath, 'r') as f:
         data = json.load(f)
     configs = {name: CameraConfig.from_dict(cfg) for name, cfg in data.items()}
-    subprocess_logger.info(f"Loaded {len(configs)} camera configs from {filepath}")
+    subprocess_logger.info("Loaded %s camera configs from %s", len(configs), filepath)
     return configs
\ No newline at end of file
@@ -8,7 +8,10 @@ import json
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Dict, Optional, List, Tuple
-from picamera2 import Picamera2
+try:
+    from picamera2 import Picamera2
+except ImportError:  # No libcamera stack (subprocess backend / development host)
+    Picamera2 = None
 
 class CameraRegistry:
     """
@@ -106,6 +109,8 @@ class CameraRegistry:
             Dict mapping camera_index -> (hardware_id, info)
         """
         detected = {}
+        if Picamera2 is None:
+            return detected
         camera_info = Picamera2.global_camera_info()
         
         for idx in range(len(camera_info)):
@@ -8,12 +8,17 @@ import socket
 import os
 import json
 import sys
+import atexit
+import functools
+import queue
+import threading
 
 backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
-from .utils import compute_sha256, setup_rotating_logger
+from . import utils as _utils
+from .utils import compute_hashes_many, setup_rotating_logger
 
 from app.core.config import settings
 
@@ -25,6 +30,9 @@ subprocess_logger = setup_rotating_logger(
     logger_name="capture_service"
 )
 
+# metadata/ directories already created by this process
+_metadata_dirs: set = set()
+
 @dataclass
 class ProjectInfo:
     """
@@ -62,6 +70,7 @@ class CaptureFile:
     bytes: int
     mimetype: str = "image/jpeg"
     sha256: Optional[str] = None
+    blake3: Optional[str] = None  # set instead of sha256 when MANIFEST_HASH=blake3
 
 
 @dataclass
@@ -137,6 +146,23 @@ def generate_manifest_project(
         default_camera_config=default_camera_config
     )
 
+def _manifest_hash_algorithm() -> str:
+    """Return the configured manifest hash, falling back to sha256 if unusable."""
+    return _resolve_hash_algorithm(settings.MANIFEST_HASH.lower())
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_hash_algorithm(algorithm: str) -> str:
+    """Validate a MANIFEST_HASH value (cached, so a bad value is only logged once)."""
+    if algorithm == "blake3" and _utils.blake3 is None:
+        subprocess_logger.warning("MANIFEST_HASH=blake3 but the blake3 package is not installed; using sha256.")
+        algorithm = "sha256"
+    elif algorithm not in _utils.HASH_FUNCTIONS:
+        subprocess_logger.warning(f"Unknown MANIFEST_HASH '{algorithm}', using sha256.")
+        algorithm = "sha256"
+    return algorithm
+
+
 def generate_manifest_record(
     project_name: str,
     img_paths: list,
@@ -145,7 +171,8 @@ def generate_manifest_record(
     pair_id: str = None,
     stagger: int = None,
     roles: list = None,
-    metadata_list: list = None) -> CaptureRecord:
+    metadata_list: list = None,
+    defer_hashes: bool = False) -> CaptureRecord:
     """
     Generate a manifest record for single or dual captures.
     
@@ -159,6 +186,9 @@ def generate_manifest_record(
         roles: List of role names (e.g., ["left", "right"] or ["single"])
                If None, auto-assigns based on number of captures
         metadata_list: List of metadata dicts from capture (optional)
+        defer_hashes: Leave the file hashes empty and have the background
+            manifest writer fill them in when the record is appended, so
+            the caller can start the next capture while the files are hashed
     
     Returns:
         CaptureRecord object
@@ -175,6 +205,7 @@ def generate_manifest_record(
     # Build files list
     # Handle both single paths and multi-format (JPEG+raw) tuples
     files = []
+    file_paths = []  # source path of each entry in files, for hashing
     for i, (path, config, role) in enumerate(zip(img_paths, cam_configs, roles)):
         # Check if path is a tuple (multi-format: JPEG + raw buffer)
         if isinstance(path, tuple):
@@ -186,8 +217,8 @@ def generate_manifest_record(
                 relative_path=str(Path("images/main") / Path(jpeg_path).name),
                 bytes=os.path.getsize(jpeg_path),
                 mimetype=f"image/{config.encoding}",
-                sha256=compute_sha256(jpeg_path)
             ))
+            file_paths.append(jpeg_path)
             
             # Add raw sensor data file
             # Note: Using .raw extension due to picamera2 DNG save bug
@@ -197,8 +228,8 @@ def generate_manifest_record(
                 relative_path=str(Path("images/main") / Path(raw_path).name),
                 bytes=os.path.getsize(raw_path),
                 mimetype="application/octet-stream",  # Binary raw sensor data
-                sha256=compute_sha256(raw_path)
             ))
+            file_paths.append(raw_path)
         else:
             # Single format
             files.append(CaptureFile(
@@ -206,8 +237,13 @@ def generate_manifest_record(
                 relative_path=str(Path("images/main") / Path(path).name),
                 bytes=os.path.getsize(path),
                 mimetype=f"image/{config.encoding}",
-                sha256=compute_sha256(path)
             ))
+            file_paths.append(path)
+    
+    pending_hashes = list(zip(files, file_paths))
+    if not defer_hashes:
+        _fill_hashes(pending_hashes)
+        pending_hashes = None
     
     # Build cameras list with metadata
     cameras = []
@@ -231,26 +267,153 @@ def generate_manifest_record(
     if stagger is not None:
         timing['stagger_ms'] = stagger
     
-    return CaptureRecord(
+    record = CaptureRecord(
         project_name=project_name,
         pair_id=pair_id,
         files=files,
         cameras=cameras,
         timing=timing,
     )
+    # Not a dataclass field, so it never ends up in the serialised record
+    record._pending_hashes = pending_hashes
+    return record
+
+
+def _fill_hashes(pending_hashes: list) -> None:
+    """Hash (CaptureFile, path) pairs in parallel and store the digests on the files."""
+    algorithm = _manifest_hash_algorithm()
+    digests = compute_hashes_many((path for _, path in pending_hashes), algorithm)
+    for capture_file, path in pending_hashes:
+        setattr(capture_file, algorithm, digests[path])
+
+
+def _record_line(record: CaptureRecord) -> str:
+    """Serialise a capture record, first hashing its files if that was deferred."""
+    pending_hashes = getattr(record, "_pending_hashes", None)
+    if pending_hashes:
+        try:
+            _fill_hashes(pending_hashes)
+        except OSError as e:
+            subprocess_logger.error(f"Failed to hash files of capture {record.capture_id}: {e}")
+        record._pending_hashes = None
+    return json.dumps(record.to_dict(), ensure_ascii=False) + "\n"
+
+
+# Capture records are written by a background thread: the capture path only
+# queues the record (hashing its files and serialising it happen here). The writer takes everything
+# queued (up to MANIFEST_BATCH_SIZE lines) and appends it with one write and
+# one fdatasync per manifest file, instead of an fsync per capture.
+MANIFEST_BATCH_SIZE = 64
+
+_manifest_queue = queue.SimpleQueue()  # (manifest_path, record, done_event)
+_manifest_writer: Optional[threading.Thread] = None
+_manifest_writer_lock = threading.Lock()
+
+
+def _write_manifest_lines(manifest_path: Path, lines: List[str]) -> None:
+    """Append *lines* to *manifest_path* with a single write and fdatasync."""
+    data = "".join(lines).encode("utf-8")
+    fd = os.open(manifest_path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        os.fdatasync(fd)
+    finally:
+        os.close(fd)
+
+
+def _manifest_writer_loop() -> None:
+    while True:
+        batch = [_manifest_queue.get()]
+        while len(batch) < MANIFEST_BATCH_SIZE:
+            try:
+                batch.append(_manifest_queue.get_nowait())
+            except queue.Empty:
+                break
+        
+        # Nothing may end this thread: flush_manifest() waits on the done
+        # events, and every later record would be dropped
+        try:
+            _write_manifest_batch(batch)
+        except Exception:
+            subprocess_logger.exception(f"Failed to write a batch of {len(batch)} manifest record(s)")
+        finally:
+            for _, _, done in batch:
+                if done is not None:
+                    done.set()
+
+
+def _write_manifest_batch(batch: list) -> None:
+    """Serialise the queued records of *batch* and append them to their manifests."""
+    by_path: Dict[Path, List[str]] = {}
+    for manifest_path, record, _ in batch:
+        if manifest_path is None:  # None marks a flush request
+            continue
+        try:
+            line = _record_line(record)
+        except Exception:
+            subprocess_logger.exception(f"Failed to serialise a capture record for {manifest_path}")
+            continue
+        by_path.setdefault(manifest_path, []).append(line)
+    for manifest_path, lines in by_path.items():
+        try:
+            _write_manifest_lines(manifest_path, lines)
+            subprocess_logger.info("Appended %s capture record(s) to %s.", len(lines), manifest_path)
+        except OSError as e:
+            subprocess_logger.error(f"Failed to append {len(lines)} record(s) to {manifest_path}: {e}")
+
+
+def _ensure_manifest_writer() -> None:
+    global _manifest_writer
+    # is_alive() is also False in a forked child, which then starts its own writer
+    if _manifest_writer is None or not _manifest_writer.is_alive():
+        with _manifest_writer_lock:
+            if _manifest_writer is None or not _manifest_writer.is_alive():
+                _manifest_writer = threading.Thread(
+                    target=_manifest_writer_loop, name="manifest-writer", daemon=True
+                )
+                _manifest_writer.start()
+
+
+def flush_manifest(timeout: Optional[float] = None) -> bool:
+    """
+    Wait until all queued capture records are on disk.
     
+    Args:
+        timeout (float): Seconds to wait at most (None waits indefinitely).
+    Returns:
+        bool: True if everything queued before the call was written.
+    """
+    if _manifest_writer is None:
+        return True
+    _ensure_manifest_writer()
+    done = threading.Event()
+    _manifest_queue.put((None, None, done))
+    return done.wait(timeout)
+
+
+atexit.register(flush_manifest, 10)
+
 
 def append_manifest_record(project_root: Path, record: Union[CaptureRecord, ProjectInfo], record_type: str = "capture"):
     """
     Append a capture or project record to the manifest file in the project directory.
     
+    Capture records are queued and written in batches by a background
+    thread (call flush_manifest() to wait for them), which also computes
+    deferred file hashes; do not modify a capture record after appending
+    it. Project records are written and synced immediately.
+    
     Args:
         project_root (Path): The root directory of the project.
         record (CaptureRecord, ProjectInfo): The capture or project record to append.
     """
     
     metadata_dir = project_root / "metadata"
-    metadata_dir.mkdir(parents=True, exist_ok=True)
+    if metadata_dir not in _metadata_dirs or not settings.CAPTURE_DIR_MEMO:
+        metadata_dir.mkdir(parents=True, exist_ok=True)
+        _metadata_dirs.add(metadata_dir)
     
     if record_type == "project":
         manifest_path = metadata_dir / "project_manifest.jsonl"
@@ -259,13 +422,11 @@ def append_manifest_record(project_root: Path, record: Union[CaptureRecord, Proj
     else:
         raise ValueError("record_type must be 'capture' or 'project'")
     
-    with open(manifest_path, 'a', encoding="utf-8") as f:
-        f.write(json.dumps(record.to_dict(), ensure_ascii=False) + "\n")
-        f.flush()
-        os.fsync(f.fileno())
-        
-        if record_type == "project":
-            subprocess_logger.info(f"Appended project record for '{record.project_name}' to manifest.")
-        else:
-            subprocess_logger.info(f"Appended capture record {record.capture_id} to manifest.")
-        
\ No newline at end of file
+    if record_type == "project":
+        line = json.dumps(record.to_dict(), ensure_ascii=False) + "\n"
+        _write_manifest_lines(manifest_path, [line])
+        subprocess_logger.info("Appended project record for '%s' to manifest.", record.project_name)
+    else:
+        _ensure_manifest_writer()
+        _manifest_queue.put((manifest_path, record, None))
+        subprocess_logger.debug("Queued capture record %s for manifest.", record.capture_id)
@@ -90,7 +90,7 @@ def default_camera_config_from_registry(
         "buffer_count": 2,
         "thumbnail": False,
         "nopreview": True,
-        "quality": 93,
+        "quality": settings.CAPTURE_JPEG_QUALITY,
         "zsl": False,
         "encoding": "jpg",
         "raw": False
@@ -139,7 +139,7 @@ def project_init(
     for path in [packages_dir]:
         path.mkdir(parents=True, exist_ok=True)
     
-    subprocess_logger.info(f"Created project directory structure: {project_path}")
+    subprocess_logger.info("Created project directory structure: %s", project_path)
     
     # Get camera configurations from registry
     registry = CameraRegistry()
@@ -186,6 +186,6 @@ def project_init(
     )
     
     append_manifest_record(project_path, project_info, record_type="project")
-    subprocess_logger.info(f"Project manifest created for: {project_name}")
+    subprocess_logger.info("Project manifest created for: %s", project_name)
     
     return project_path
\ No newline at end of file
@@ -1,9 +1,16 @@
+import asyncio
+import atexit
+import json
+import os
+import shutil
 import sys
+import tempfile
 from pathlib import Path
 import time
 import threading
-from datetime import datetime, timezone
 import concurrent.futures
+import functools
+import itertools
 from typing import Optional
 
 # Fixed temp-file paths for live preview frames (one per camera).
@@ -31,7 +38,7 @@ if str(backend_dir) not in sys.path:
 from .utils import setup_rotating_logger
 from .camera import CameraConfig
 from .manifestHandler import generate_manifest_record, append_manifest_record
-from .backends import CameraBackend, RpicamBackend, Picamera2Backend
+from .backends import CameraBackend, RpicamBackend, RpicamSignalBackend, Picamera2Backend
 from .project_manager import secure_project_filename
 
 from app.core.config import settings
@@ -47,15 +54,16 @@ subprocess_logger = setup_rotating_logger(
 
 # Route picamera2's own log output into the same rotating log file.
 # picamera2 uses Python's standard logging under the "picamera2" namespace,
-# so we attach a single RotatingFileHandler from the existing logger.
+# so we attach the existing logger's queue handler (file writes stay on the
+# background listener thread).
 import logging as _logging
-from logging.handlers import RotatingFileHandler as _RFH
+from logging.handlers import QueueHandler as _QH
 _picamera2_logger = _logging.getLogger("picamera2")
 if not _picamera2_logger.handlers:
-    _rfh = next((h for h in subprocess_logger.handlers if isinstance(h, _RFH)), None)
-    if _rfh:
+    _qh = next((h for h in subprocess_logger.handlers if isinstance(h, _QH)), None)
+    if _qh:
         _picamera2_logger.setLevel(_logging.DEBUG)
-        _picamera2_logger.addHandler(_rfh)
+        _picamera2_logger.addHandler(_qh)
 
 # Initialize camera backend based on configuration
 def get_camera_backend() -> CameraBackend:
@@ -68,9 +76,21 @@ def get_camera_backend() -> CameraBackend:
     backend_type = settings.CAMERA_BACKEND.lower()
     
     if backend_type == "picamera2":
-        return Picamera2Backend(subprocess_logger)
+        # One persistent Picamera2 instance per camera, so captures skip the
+        # process spawn and libcamera start-up of rpicam-still
+        try:
+            return Picamera2Backend(subprocess_logger)
+        except RuntimeError as e:
+            # Only fall back if rpicam-still is there to fall back to;
+            # otherwise report the picamera2 error as before
+            if shutil.which("rpicam-still") is None:
+                raise
+            subprocess_logger.warning(f"{e}; falling back to subprocess backend.")
+            return RpicamBackend(subprocess_logger)
     elif backend_type == "subprocess":
         return RpicamBackend(subprocess_logger)
+    elif backend_type == "subprocess-signal":
+        return RpicamSignalBackend(subprocess_logger)
     else:
         subprocess_logger.warning(f"Unknown backend '{backend_type}', defaulting to subprocess.")
         return RpicamBackend(subprocess_logger)
@@ -83,27 +103,267 @@ def get_backend() -> CameraBackend:
     global _backend
     if _backend is None:
         _backend = get_camera_backend()
-        subprocess_logger.info(f"Initialized camera backend: {_backend.get_backend_name()}")
+        subprocess_logger.info("Initialized camera backend: %s", _backend.get_backend_name())
     return _backend
 
 
+# Persistent worker threads for parallel captures, reused across calls
+# instead of spawning and joining a fresh pool for every dual capture.
+# Four workers so two overlapping dual captures (or a capture during stagger
+# calibration) don't queue behind each other.
+_CAPTURE_POOL_WORKERS = 4
+
+# Optional CPU cores for the capture workers (CAPTURE_CPU_CORES="2,3").
+# Pinning keeps the camera threads, and the rpicam-still processes they
+# spawn, off the cores busy with FastAPI, logging and manifest I/O, which
+# reduces jitter inside the stagger window. Pair with isolcpus= on the Pi.
+_CAPTURE_CPU_CORES = tuple(
+    int(core) for core in settings.CAPTURE_CPU_CORES.split(",") if core.strip()
+)
+_capture_worker_ids = itertools.count()
+
+
+def _pin_capture_worker() -> None:
+    """Pool initializer: pin this worker thread to one of _CAPTURE_CPU_CORES (round-robin)."""
+    core = _CAPTURE_CPU_CORES[next(_capture_worker_ids) % len(_CAPTURE_CPU_CORES)]
+    try:
+        os.sched_setaffinity(0, {core})  # 0 = the calling thread on Linux
+    except (AttributeError, OSError) as e:
+        subprocess_logger.warning(f"Could not pin capture worker to CPU {core}: {e}")
+
+
+def _new_capture_pool() -> concurrent.futures.ThreadPoolExecutor:
+    return concurrent.futures.ThreadPoolExecutor(
+        max_workers=_CAPTURE_POOL_WORKERS,
+        thread_name_prefix="cap",
+        initializer=_pin_capture_worker if _CAPTURE_CPU_CORES else None,
+    )
+
+
+_capture_pool = _new_capture_pool()
+atexit.register(lambda: _capture_pool.shutdown())
+
+
+def _reset_capture_pool() -> None:
+    """Give a forked child its own pool; the parent's worker threads don't exist there."""
+    global _capture_pool
+    _capture_pool = _new_capture_pool()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_capture_pool)
+
+# Output directories already created by this process. Captures into an
+# existing project skip the mkdir/stat syscalls after the first shot.
+_ensured_dirs: set = set()
+
+def _ensure_dir(path: Path) -> None:
+    """Create *path* (with parents) once per process (every call if CAPTURE_DIR_MEMO is off)."""
+    if path not in _ensured_dirs or not settings.CAPTURE_DIR_MEMO:
+        path.mkdir(parents=True, exist_ok=True)
+        _ensured_dirs.add(path)
+
+
+def _image_dir(project_name: str, collection_name: Optional[str] = None) -> Path:
+    """Return (creating if needed) the images/main directory for a project or collection."""
+    if collection_name:
+        project_path = PROJECTS_ROOT / secure_project_filename(project_name) / secure_project_filename(collection_name) / "images" / "main"
+    else:
+        project_path = PROJECTS_ROOT / secure_project_filename(project_name) / "images" / "main"
+    _ensure_dir(project_path)
+    return project_path
+
+
+# Camera presence per index as (time.monotonic(), connected). The camera
+# topology rarely changes within a session, so a probe result is reused
+# for CAMERA_CACHE_TTL seconds instead of re-probing before every capture.
+CAMERA_CACHE_TTL = 30.0
+_conn_cache: dict = {}
+
+# Cameras found by the one-shot discovery at service start (refresh_cameras).
+# While set, presence checks are a set lookup and never probe.
+_connected_cameras: Optional[frozenset] = None
+
+
+def invalidate_camera_cache() -> None:
+    """Forget cached camera presence, e.g. after cameras were plugged or unplugged."""
+    global _connected_cameras
+    _connected_cameras = None
+    _conn_cache.clear()
+    _verified_until.clear()
+    if _backend is not None and hasattr(_backend, "_camera_info"):
+        _backend._camera_info = None  # picamera2's cached global_camera_info()
+
+
+def refresh_cameras() -> Optional[frozenset]:
+    """
+    Discover all connected cameras with a single listing and cache the result.
+    
+    Returns:
+        frozenset: Indices of the connected cameras, or None if the backend
+            could not list them (presence is then probed per camera).
+    """
+    global _connected_cameras
+    invalidate_camera_cache()
+    listed = get_backend().list_cameras()
+    if listed is not None:
+        _connected_cameras = frozenset(listed)
+    return _connected_cameras
+
+
+def startup_camera_discovery() -> Optional[frozenset]:
+    """Run the one-shot camera discovery at service start (see refresh_cameras)."""
+    cameras = refresh_cameras()
+    if cameras is None:
+        subprocess_logger.warning("Camera discovery unavailable; cameras will be probed on demand.")
+    else:
+        subprocess_logger.info("Discovered cameras: %s", sorted(cameras))
+    return cameras
+
+
+def prewarm_cameras(*camera_configs: CameraConfig) -> list:
+    """
+    Configure and start cameras in parallel ahead of the next capture.
+    
+    With the picamera2 backend the cameras then keep streaming, so the next
+    capture with the same settings only waits for AF/AE and a frame instead
+    of configure, start and denoise warmup. A no-op for the subprocess
+    backends.
+    
+    Returns:
+        list: Indices of the cameras that were prewarmed (failures are logged).
+    """
+    backend = get_backend()
+    futures = [_capture_pool.submit(backend.prewarm, config) for config in camera_configs]
+    prewarmed = []
+    for config, future in zip(camera_configs, futures):
+        try:
+            future.result()
+            prewarmed.append(config.camera_index)
+        except Exception as e:
+            subprocess_logger.warning(f"Could not prewarm camera {config.camera_index}: {e}")
+    return prewarmed
+
+
 def is_camera_connected(camera_index: int = 0) -> bool:
     """
     Check if the camera is connected using --list-cameras (fast, no initialization).
     
+    After startup_camera_discovery() this is a lookup in the discovered set;
+    otherwise results are cached for CAMERA_CACHE_TTL seconds (see
+    invalidate_camera_cache).
+    
     Args:
         camera_index (int): The index of the camera to check (default is 0).
     Returns:
         bool: True if the camera is connected, False otherwise.
     """
+    if _connected_cameras is not None:
+        return camera_index in _connected_cameras
+    
+    entry = _conn_cache.get(camera_index)
+    if entry is not None and time.monotonic() - entry[0] < CAMERA_CACHE_TTL:
+        return entry[1]
+    
     backend = get_backend()
-    return backend.is_camera_connected(camera_index)
+    connected = backend.is_camera_connected(camera_index)
+    _conn_cache[camera_index] = (time.monotonic(), connected)
+    return connected
+
+
+def _probe_cameras(*camera_indices: int) -> None:
+    """
+    Refresh the presence cache for several cameras with a single listing.
+    
+    Does nothing if all are cached; if the backend cannot list cameras in one
+    call, the following is_camera_connected calls probe them one by one.
+    """
+    if _connected_cameras is not None:
+        return
+    now = time.monotonic()
+    stale = [
+        i for i in camera_indices
+        if i not in _conn_cache or now - _conn_cache[i][0] >= CAMERA_CACHE_TTL
+    ]
+    if len(stale) < 2:
+        return
+    listed = get_backend().list_cameras()
+    if listed is None:
+        return
+    now = time.monotonic()
+    for i in stale:
+        _conn_cache[i] = (now, i in listed)
+
+
+# Per camera index, the time.monotonic() until which a presence check done by
+# verify_cameras() counts. Callers that already verified (e.g. the API layer)
+# pass the returned token down so nested capture calls skip a second probe.
+VERIFICATION_WINDOW = 5.0
+_verified_until: dict = {}
+
+
+def verify_cameras(*camera_indices: int) -> int:
+    """
+    Check that cameras are connected and issue a verification token.
+    
+    Pass the token as ``verification_token`` to the capture functions: for
+    the next VERIFICATION_WINDOW seconds they skip their own presence check
+    for these cameras, even with ``check_camera=True``.
+    
+    Returns:
+        int: The verification token (``time.monotonic_ns()`` of the check).
+    Raises:
+        RuntimeError: If one of the cameras is not connected.
+    """
+    _probe_cameras(*camera_indices)
+    for camera_index in camera_indices:
+        if not is_camera_connected(camera_index):
+            raise RuntimeError(f"Camera {camera_index} is not connected.")
+    token = time.monotonic_ns()
+    deadline = token / 1e9 + VERIFICATION_WINDOW
+    for camera_index in camera_indices:
+        _verified_until[camera_index] = deadline
+    return token
+
+
+def _check_cameras(check_camera: bool, verification_token: Optional[int], *camera_indices: int) -> None:
+    """
+    Raise RuntimeError unless the cameras are connected.
+    
+    Skipped if *verification_token* is given and every camera was verified
+    within the window; an expired token always re-checks.
+    """
+    if verification_token is not None:
+        now = time.monotonic()
+        if all(_verified_until.get(i, 0.0) > now for i in camera_indices):
+            return
+    elif not check_camera:
+        return
+    verify_cameras(*camera_indices)
+
+
+def _timestamp_index(ts_ns: int) -> str:
+    """Format a ``time.time_ns()`` value as a UTC ``YYYYmmdd_HHMMSS_mmm`` index."""
+    seconds, remainder = divmod(ts_ns, 1_000_000_000)
+    t = time.gmtime(seconds)
+    return (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_"
+        f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}_{remainder // 1_000_000:03d}"
+    )
+
+
+@functools.lru_cache(maxsize=8)
+def _ext(image_encoding: str) -> str:
+    """Return the filename extension (with leading dot) for an encoding."""
+    return image_encoding if image_encoding.startswith('.') else f".{image_encoding}"
+
 
 def image_filename(
     camera_index: int, 
-    index: str = None,
-    img_size: tuple = None,
-    image_encoding: str = "jpg") -> str:
+    index: Optional[str] = None,
+    img_size: Optional[tuple] = None,
+    image_encoding: str = "jpg",
+    ts_ns: Optional[int] = None) -> str:
     """
     Generate a compact image filename with timestamp and camera index.
     
@@ -115,23 +375,19 @@ def image_filename(
     Args:
         camera_index (int): The camera index.
         index (str): Custom index/counter. If None, uses UTC timestamp with ms.
-        include_resolution (bool): Whether to include resolution in filename.
-        img_size (tuple): The image size as (width, height), required if include_resolution=True.
+        img_size (tuple): The image size as (width, height) to include in the
+            filename, or None to leave the resolution out.
+        image_encoding (str): Image encoding, used for the file extension.
+        ts_ns (int): Timestamp from ``time.time_ns()`` to use for the default index
+            instead of reading the clock (ignored when ``index`` is given).
     Returns:
         str: The generated image filename.
     """
     if not index:
-        now = datetime.now(timezone.utc)
-        index = now.strftime("%Y%m%d_%H%M%S") + f"_{now.microsecond // 1000:03d}"
-    
-    filename = f"{index}_c{camera_index}"
+        index = _timestamp_index(ts_ns if ts_ns is not None else time.time_ns())
     
-    if img_size:
-        width, height = img_size
-        filename += f"_{width}x{height}"
-    
-    filename += image_encoding if image_encoding.startswith('.') else f".{image_encoding}"
-    return filename
+    resolution = f"_{img_size[0]}x{img_size[1]}" if img_size else ""
+    return f"{index}_c{camera_index}{resolution}{_ext(image_encoding)}"
     
 
 def capture_image(
@@ -141,7 +397,8 @@ def capture_image(
         check_camera: bool = True,
         include_resolution: bool = False,
         capture_output: bool = False,
-        collection_name: Optional[str] = None) -> str:
+        collection_name: Optional[str] = None,
+        verification_token: Optional[int] = None) -> str:
     """
     Capture an image using the rpicam-still command.
     
@@ -152,18 +409,82 @@ def capture_image(
         check_camera (bool): Whether to check camera availability before capture (default is True).
         include_resolution (bool): Include resolution in auto-generated filename (default is False).
         capture_output (bool): Capture stderr/stdout for debugging (default is False for performance).
+        verification_token (int): Token from verify_cameras(); skips the check while still valid.
     Returns:
         str: The path to the captured image file.
     """
     
-    if check_camera and not is_camera_connected(camera_config.camera_index):
-        raise RuntimeError(f"Camera {camera_config.camera_index} is not connected.")
+    _check_cameras(check_camera, verification_token, camera_config.camera_index)
     
-    if collection_name:
-        project_path = PROJECTS_ROOT / secure_project_filename(project_name) / secure_project_filename(collection_name) / "images" / "main"
-    else:
-        project_path = PROJECTS_ROOT / secure_project_filename(project_name) / "images" / "main"
-    project_path.mkdir(parents=True, exist_ok=True)
+    output_path = _output_path(project_name, camera_config, output_filename, include_resolution, collection_name)
+    
+    # Use backend for actual capture
+    backend = get_backend()
+    return _capture_result(backend.capture_image(output_path, camera_config, capture_output))
+
+
+def capture_image_deferred(
+        project_name: str,
+        camera_config: CameraConfig,
+        output_filename: Optional[str] = None,
+        check_camera: bool = True,
+        include_resolution: bool = False,
+        collection_name: Optional[str] = None,
+        verification_token: Optional[int] = None) -> tuple:
+    """
+    Capture an image and return as soon as the camera is free again.
+    
+    With the picamera2 backend the frame is encoded and written on the
+    writer pool, so a caller taking shots back-to-back overlaps the next
+    exposure with the previous save. Other backends complete the write
+    before returning.
+    
+    Returns:
+        tuple: (path_or_paths, metadata, write_future). Call
+            ``write_future.result()`` before reading the file; it returns
+            the saved path(s) or raises RuntimeError if saving failed.
+    """
+    _check_cameras(check_camera, verification_token, camera_config.camera_index)
+    
+    output_path = _output_path(project_name, camera_config, output_filename, include_resolution, collection_name)
+    return get_backend().capture_image_deferred(output_path, camera_config)
+
+
+async def capture_image_async(
+        project_name: str,
+        camera_config: CameraConfig,
+        output_filename: Optional[str] = None,
+        include_resolution: bool = False,
+        capture_output: bool = False,
+        collection_name: Optional[str] = None) -> tuple:
+    """
+    Async variant of ``capture_image`` for use on an event loop.
+    
+    With the subprocess backend rpicam-still is awaited directly, so no
+    thread is tied up for the duration of the capture. Camera availability
+    is not checked here (``is_camera_connected`` is blocking).
+    
+    Returns:
+        tuple: (path_or_paths, metadata), like ``capture_image``.
+    """
+    output_path = _output_path(project_name, camera_config, output_filename, include_resolution, collection_name)
+    backend = get_backend()
+    return _capture_result(await backend.capture_image_async(output_path, camera_config, capture_output))
+
+
+def _output_path(
+        project_name: str,
+        camera_config: CameraConfig,
+        output_filename: Optional[str],
+        include_resolution: bool,
+        collection_name: Optional[str]) -> str:
+    """
+    Resolve the full output path for a capture, generating a filename if needed.
+    
+    Returned as a plain string: backends only need it for argv/open(), so
+    joining with os.sep skips building and normalising a Path per capture.
+    """
+    project_path = _image_dir(project_name, collection_name)
     
     if not output_filename:
         output_filename = image_filename(
@@ -172,17 +493,17 @@ def capture_image(
             image_encoding=camera_config.encoding
         )
     
-    output_path = Path(project_path, output_filename)
-    
-    # Use backend for actual capture
-    backend = get_backend()
-    result = backend.capture_image(output_path, camera_config, capture_output)
+    return f"{project_path}{os.sep}{output_filename}"
+
+
+def _capture_result(result) -> tuple:
+    """
+    Normalise a backend result to (path_or_paths, metadata).
     
-    # Handle different return types
-    # Result is always (path_or_paths, metadata)
-    # path_or_paths can be:
-    #   - single path string for JPEG/PNG only
-    #   - tuple (jpeg_path, dng_path) for multi-format
+    path_or_paths can be:
+      - single path string for JPEG/PNG only
+      - tuple (jpeg_path, dng_path) for multi-format
+    """
     if isinstance(result, tuple) and len(result) == 2:
         return result  # (path_or_paths, metadata)
     else:
@@ -194,7 +515,8 @@ def single_capture_image(
         camera_config: CameraConfig,
         check_camera: bool = True,
         include_resolution: bool = False,
-        collection_name: Optional[str] = None) -> tuple:
+        collection_name: Optional[str] = None,
+        verification_token: Optional[int] = None) -> tuple:
     """
     Capture an image from a single camera.
     
@@ -203,14 +525,14 @@ def single_capture_image(
         camera_config (CameraConfig): Configuration for the camera.
         check_camera (bool): Whether to check camera availability before capture.
         include_resolution (bool): Include resolution in auto-generated filename.
+        verification_token (int): Token from verify_cameras(); skips the check while still valid.
     Returns:
         tuple: (output_path, capture_id, pair_id) - path to image and manifest IDs.
     """
     
-    if check_camera and not is_camera_connected(camera_config.camera_index):
-        raise RuntimeError(f"Camera {camera_config.camera_index} is not connected.")
+    _check_cameras(check_camera, verification_token, camera_config.camera_index)
     
-    start_time = time.time()
+    start_time = time.monotonic_ns()
     
     output_path, metadata = capture_image(
         project_name=project_name,
@@ -220,7 +542,7 @@ def single_capture_image(
         collection_name=collection_name
     )
     
-    elapsed_time = time.time() - start_time
+    elapsed_time = (time.monotonic_ns() - start_time) / 1e9
     
     project_root = PROJECTS_ROOT / project_name
     
@@ -229,24 +551,245 @@ def single_capture_image(
         img_paths=[output_path],
         cam_configs=[camera_config],
         times=[elapsed_time],
-        metadata_list=[metadata] if metadata else None
+        metadata_list=[metadata] if metadata else None,
+        defer_hashes=True  # hashed by the manifest writer
     )
     append_manifest_record(project_root, record)
     
     subprocess_logger.info(
-        f"Single capture: cam{camera_config.camera_index}={elapsed_time:.3f}s, capture_id={record.capture_id}"
+        "Single capture: cam%s=%.3fs, capture_id=%s",
+        camera_config.camera_index, elapsed_time, record.capture_id
     )
     
     return output_path, record.capture_id, record.pair_id
 
+# Calibrated camera-start stagger, stored next to the camera registry
+# (PROJECTS_ROOT/cameras.json) and keyed by backend and camera pair.
+STAGGER_CALIBRATION_FILE = PROJECTS_ROOT / "stagger_calibration.json"
+STAGGER_CANDIDATES_MS = (0, 5, 10, 15, 20, 40)
+DEFAULT_STAGGER_MS = 20
+
+_stagger_cache: dict = {}
+_stagger_lock = threading.Lock()
+
+
+def _delayed(delay: float, fn, *args):
+    """Sleep *delay* seconds on the calling worker, then run fn(*args)."""
+    if delay > 0:
+        time.sleep(delay)
+    return fn(*args)
+
+
+def _capture_jobs(backend, jobs, stagger_ms: int) -> list:
+    """
+    Capture one image per (output_path, camera_config) job, ``stagger_ms`` apart.
+    
+    Used by both capture_batch and calibrate_stagger, so the calibrated
+    stagger is measured with the launch pattern real captures use. Backends
+    that batch natively (``capture_images``, e.g. rpicam-still) capture all
+    cameras from the calling thread. Otherwise all captures are submitted to
+    the capture pool at once; worker ``i`` sleeps ``i * stagger_ms`` itself
+    before capturing, so the calling thread never blocks on the stagger.
+    
+    Returns:
+        list: (path_or_paths, elapsed_seconds, metadata) per job, in job
+            order. elapsed_seconds is the camera's own capture time, without
+            its stagger.
+    Raises:
+        RuntimeError: The first failure, once every capture has finished.
+    """
+    if type(backend).capture_images is not CameraBackend.capture_images:
+        results = []
+        for result, elapsed in backend.capture_images(jobs, stagger_ms):
+            path, metadata = _capture_result(result)
+            results.append((path, elapsed, metadata))
+        return results
+    
+    def capture_with_timing(output_path, config):
+        start = time.monotonic_ns()
+        path, metadata = _capture_result(backend.capture_image(output_path, config))
+        return path, (time.monotonic_ns() - start) / 1e9, metadata
+    
+    futures = [
+        _capture_pool.submit(_delayed, i * stagger_ms / 1000.0, capture_with_timing, output_path, config)
+        for i, (output_path, config) in enumerate(jobs)
+    ]
+    
+    # Wait for all to complete (even if one fails, so no capture is still
+    # running on a camera when this call returns)
+    concurrent.futures.wait(futures, return_when=concurrent.futures.ALL_COMPLETED)
+    return [f.result() for f in futures]
+
+
+def _stagger_key(cam1_config: CameraConfig, cam2_config: CameraConfig) -> str:
+    indices = sorted((cam1_config.camera_index, cam2_config.camera_index))
+    return f"{get_backend().get_backend_name()}:{indices[0]}-{indices[1]}"
+
+
+def calibrate_stagger(
+        cam1_config: CameraConfig,
+        cam2_config: CameraConfig,
+        candidates: tuple = STAGGER_CANDIDATES_MS,
+        iterations: int = 3) -> int:
+    """
+    Find the smallest stagger at which parallel captures reliably succeed.
+    
+    Each candidate (in ascending order) is tried for ``iterations`` dual
+    captures into a scratch directory; the first one with no failures is
+    stored in STAGGER_CALIBRATION_FILE and returned. If none succeeds,
+    DEFAULT_STAGGER_MS is stored instead, so a broken pair isn't swept
+    again on every start (delete its entry to recalibrate).
+    
+    Args:
+        cam1_config (CameraConfig): Configuration for camera 1.
+        cam2_config (CameraConfig): Configuration for camera 2.
+        candidates (tuple): Stagger values in ms to try.
+        iterations (int): Dual captures per candidate.
+    Returns:
+        int: The calibrated stagger in ms, or DEFAULT_STAGGER_MS if no
+            candidate succeeded.
+    """
+    backend = get_backend()
+    key = _stagger_key(cam1_config, cam2_config)
+    
+    with tempfile.TemporaryDirectory(prefix="dtk_stagger_") as scratch:
+        scratch = Path(scratch)
+        for stagger_ms in sorted(candidates):
+            ok = True
+            for i in range(iterations):
+                jobs = [
+                    (scratch / f"{i}_{stagger_ms}_c1.{cam1_config.encoding}", cam1_config),
+                    (scratch / f"{i}_{stagger_ms}_c2.{cam2_config.encoding}", cam2_config),
+                ]
+                try:
+                    _capture_jobs(backend, jobs, stagger_ms)
+                except Exception:
+                    ok = False
+                    break
+            subprocess_logger.info("Stagger calibration %s: %sms %s", key, stagger_ms, 'ok' if ok else 'failed')
+            if ok:
+                break
+        else:
+            subprocess_logger.warning(
+                f"Stagger calibration {key}: no candidate succeeded, using {DEFAULT_STAGGER_MS}ms"
+            )
+            stagger_ms = DEFAULT_STAGGER_MS
+    
+    with _stagger_lock:
+        try:
+            data = json.loads(STAGGER_CALIBRATION_FILE.read_text())
+        except (FileNotFoundError, ValueError):
+            data = {}
+        data[key] = stagger_ms
+        STAGGER_CALIBRATION_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STAGGER_CALIBRATION_FILE.write_text(json.dumps(data, indent=2))
+        _stagger_cache[key] = stagger_ms
+    return stagger_ms
+
+
+def _load_stagger_ms(key: str) -> Optional[int]:
+    """Return the stored stagger for *key*, or None if it was never calibrated."""
+    stagger_ms = _stagger_cache.get(key)
+    if stagger_ms is not None:
+        return stagger_ms
+    
+    with _stagger_lock:
+        try:
+            stored = json.loads(STAGGER_CALIBRATION_FILE.read_text())
+        except (FileNotFoundError, ValueError):
+            stored = {}
+        if key in stored:
+            _stagger_cache[key] = stored[key]
+            return stored[key]
+    return None
+
+
+def get_stagger_ms(cam1_config: CameraConfig, cam2_config: CameraConfig) -> int:
+    """
+    Return the calibrated stagger for a camera pair.
+    
+    Never calibrates: a pair without a stored value gets DEFAULT_STAGGER_MS,
+    so a capture request doesn't turn into a calibration sweep. Calibration
+    runs at startup (see calibrate_missing_staggers).
+    
+    Args:
+        cam1_config (CameraConfig): Configuration for camera 1.
+        cam2_config (CameraConfig): Configuration for camera 2.
+    Returns:
+        int: Stagger in ms.
+    """
+    stagger_ms = _load_stagger_ms(_stagger_key(cam1_config, cam2_config))
+    return DEFAULT_STAGGER_MS if stagger_ms is None else stagger_ms
+
+
+def calibrate_missing_staggers(*configs: CameraConfig) -> None:
+    """
+    Calibrate the stagger of each neighbouring camera pair that has none stored.
+    
+    Args:
+        *configs (CameraConfig): Camera configs in capture order.
+    """
+    for cam1_config, cam2_config in zip(configs, configs[1:]):
+        if _load_stagger_ms(_stagger_key(cam1_config, cam2_config)) is None:
+            calibrate_stagger(cam1_config, cam2_config)
+
+
+def capture_batch(
+        project_name: str,
+        configs: list,
+        check_camera: bool = True,
+        include_resolution: bool = False,
+        stagger_ms: Optional[int] = None,
+        collection_name: Optional[str] = None,
+        verification_token: Optional[int] = None) -> tuple:
+    """
+    Capture one image per camera config in parallel (any number of cameras).
+    
+    Cameras start ``stagger_ms`` apart (see _capture_jobs). Filenames share
+    one timestamp index, which is also the manifest pair_id.
+    
+    Args:
+        project_name (str): The name of the project to save the images in.
+        configs (list): One CameraConfig per camera, in capture order.
+        check_camera (bool): Whether to check camera availability before capture.
+        include_resolution (bool): Include resolution in auto-generated filenames.
+        stagger_ms (int): Delay in ms between consecutive camera starts. If None,
+            the largest calibrated value of neighbouring cameras is used (see
+            get_stagger_ms). Ignored when every config sets ``sync_role``.
+        verification_token (int): Token from verify_cameras(); skips the check while still valid.
+    Returns:
+        tuple: (paths, capture_id, pair_id) - list of image paths (in config
+            order) and manifest IDs.
+    """
+    
+    _check_cameras(check_camera, verification_token, *(c.camera_index for c in configs))
+    
+    timestamp_index, filenames = _batch_filenames(configs, include_resolution)
+    
+    # Software-synced cameras align on the server's frame boundary,
+    # so the stagger sleep would only add latency.
+    if all(c.sync_role for c in configs):
+        stagger_ms = 0
+    elif stagger_ms is None:
+        stagger_ms = max((get_stagger_ms(a, b) for a, b in zip(configs, configs[1:])), default=0)
+    
+    jobs = [
+        (_output_path(project_name, config, fname, include_resolution, collection_name), config)
+        for config, fname in zip(configs, filenames)
+    ]
+    results = _capture_jobs(get_backend(), jobs, stagger_ms)
+    return _record_batch(project_name, timestamp_index, configs, results, stagger_ms)
+
+
 def dual_capture_image(
         project_name: str,
         cam1_config: CameraConfig,
         cam2_config: CameraConfig,
         check_camera: bool = True,
         include_resolution: bool = False,
-        stagger_ms: int = 20,
-        collection_name: Optional[str] = None) -> tuple:
+        stagger_ms: Optional[int] = None,
+        collection_name: Optional[str] = None,
+        verification_token: Optional[int] = None) -> tuple:
     """
     Capture images from two cameras in parallel with independent configurations.
     
@@ -256,7 +799,11 @@ def dual_capture_image(
         cam2_config (CameraConfig): Configuration for camera 2.
         check_camera (bool): Whether to check camera availability before capture.
         include_resolution (bool): Include resolution in auto-generated filenames.
-        stagger_ms (int): Delay in ms between starting cameras (default is 20ms).
+        stagger_ms (int): Delay in ms between starting cameras. If None, the
+            calibrated value for this camera pair is used (see get_stagger_ms).
+            Ignored when both configs set ``sync_role``: libcamera software sync
+            then aligns the frames and no blind sleep is needed.
+        verification_token (int): Token from verify_cameras(); skips the check while still valid.
     Returns:
         tuple: (path1, path2, capture_id, pair_id) - paths to images and manifest IDs.
         
@@ -265,83 +812,134 @@ def dual_capture_image(
         cam2 = CameraConfig(camera_index=1, hflip=True, awb="indoor")
         path1, path2, capture_id, pair_id = dual_capture_image("myproject", cam1, cam2)
     """
-    
-    if check_camera:
-        if not is_camera_connected(cam1_config.camera_index):
-            raise RuntimeError(f"Camera {cam1_config.camera_index} is not connected.")
-        if not is_camera_connected(cam2_config.camera_index):
-            raise RuntimeError(f"Camera {cam2_config.camera_index} is not connected.")
-        
-    # Pre-generate filenames with same timestamp index for pairing
-    now = datetime.now(timezone.utc)
-    timestamp_index = now.strftime("%Y%m%d_%H%M%S") + f"_{now.microsecond // 1000:03d}"
-    
-    filename1 = image_filename(
-        camera_index=cam1_config.camera_index,
-        index=timestamp_index,
-        img_size=cam1_config.img_size if include_resolution else None,
-        image_encoding=cam1_config.encoding
-    )
-    filename2 = image_filename(
-        camera_index=cam2_config.camera_index,
-        index=timestamp_index,
-        img_size=cam2_config.img_size if include_resolution else None,
-        image_encoding=cam2_config.encoding
+    (path1, path2), capture_id, pair_id = capture_batch(
+        project_name, [cam1_config, cam2_config], check_camera, include_resolution,
+        stagger_ms, collection_name, verification_token
     )
+    return path1, path2, capture_id, pair_id
+
+
+async def dual_capture_image_async(
+        project_name: str,
+        cam1_config: CameraConfig,
+        cam2_config: CameraConfig,
+        include_resolution: bool = False,
+        stagger_ms: Optional[int] = None,
+        collection_name: Optional[str] = None) -> tuple:
+    """
+    Async variant of ``dual_capture_image`` for use on an event loop.
+    
+    Both captures run as tasks on the calling loop instead of on the capture
+    thread pool. Camera availability is not checked here.
+    
+    Returns:
+        tuple: (path1, path2, capture_id, pair_id), like ``dual_capture_image``.
+    """
+    timestamp_index, (filename1, filename2) = _batch_filenames([cam1_config, cam2_config], include_resolution)
     
-    timing = {}
+    if cam1_config.sync_role and cam2_config.sync_role:
+        stagger_ms = 0
+    elif stagger_ms is None:
+        # Reads the calibration file on first use
+        stagger_ms = await asyncio.to_thread(get_stagger_ms, cam1_config, cam2_config)
     
-    def capture_with_timing(config, fname):
-        start = time.time()
-        path, metadata = capture_image(
+    async def capture_with_timing(config, fname):
+        start = time.monotonic_ns()
+        path, metadata = await capture_image_async(
             project_name=project_name,
             camera_config=config,
             output_filename=fname,
-            check_camera=False,  # Already checked
             include_resolution=include_resolution,
-            capture_output=False,  # Max performance
             collection_name=collection_name
         )
-        elapsed = time.time() - start
+        elapsed = (time.monotonic_ns() - start) / 1e9
         return path, elapsed, metadata
     
-    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
-        # Submit first camera
-        future1 = executor.submit(capture_with_timing, cam1_config, filename1)
-        
-        # Stagger second camera start (like bash script)
-        if stagger_ms > 0:
-            time.sleep(stagger_ms / 1000.0)
-        
-        future2 = executor.submit(capture_with_timing, cam2_config, filename2)
-        
-        # Wait for both to complete
-        img1_path, time1, metadata1 = future1.result()
-        img2_path, time2, metadata2 = future2.result()
-        
+    task1 = asyncio.create_task(capture_with_timing(cam1_config, filename1))
+    if stagger_ms > 0:
+        await asyncio.sleep(stagger_ms / 1000.0)
+    task2 = asyncio.create_task(capture_with_timing(cam2_config, filename2))
+    
+    # return_exceptions: let both finish before raising, as in dual_capture_image
+    result1, result2 = await asyncio.gather(task1, task2, return_exceptions=True)
+    for result in (result1, result2):
+        if isinstance(result, BaseException):
+            raise result
+    
+    # The manifest append fsyncs, so keep it off the event loop
+    (path1, path2), capture_id, pair_id = await asyncio.to_thread(
+        _record_batch, project_name, timestamp_index, [cam1_config, cam2_config],
+        [result1, result2], stagger_ms
+    )
+    return path1, path2, capture_id, pair_id
+
+
+def _batch_filenames(configs: list, include_resolution: bool) -> tuple:
+    """
+    Generate the filenames of a multi-camera capture with the same timestamp index.
+    
+    One clock read, formatted once and shared by all filenames and the pair_id.
+    
+    Returns:
+        tuple: (timestamp_index, filenames)
+    """
+    timestamp_index = _timestamp_index(time.time_ns())
+    filenames = [
+        image_filename(
+            camera_index=config.camera_index,
+            index=timestamp_index,
+            img_size=config.img_size if include_resolution else None,
+            image_encoding=config.encoding
+        )
+        for config in configs
+    ]
+    return timestamp_index, filenames
+
+
+def _record_batch(
+        project_name: str,
+        timestamp_index: str,
+        configs: list,
+        results: list,
+        stagger_ms: int) -> tuple:
+    """
+    Append the manifest record for a multi-camera capture.
+    
+    Args:
+        results: (path, elapsed_seconds, metadata) per camera, in config order.
+    Returns:
+        tuple: (paths, capture_id, pair_id)
+    """
+    paths = [path for path, _, _ in results]
+    times = [elapsed for _, elapsed, _ in results]
+    
     project_root = PROJECTS_ROOT / project_name
     
     # Prepare metadata list (filter out None values)
-    metadata_list = [m for m in [metadata1, metadata2] if m is not None]
+    metadata_list = [metadata for _, _, metadata in results if metadata is not None]
     
     record = generate_manifest_record(
         project_name=project_name,
         pair_id=timestamp_index,
-        img_paths=[img1_path, img2_path],
-        cam_configs=[cam1_config, cam2_config],
-        times=[time1, time2],
+        img_paths=paths,
+        cam_configs=configs,
+        times=times,
         stagger=stagger_ms,
-        metadata_list=metadata_list if metadata_list else None
+        metadata_list=metadata_list if metadata_list else None,
+        defer_hashes=True  # hashed by the manifest writer
     )
     append_manifest_record(project_root, record)
     
-    subprocess_logger.info(
-        f"Parallel capture: cam{cam1_config.camera_index}={time1:.3f}s, cam{cam2_config.camera_index}={time2:.3f}s, "
-        f"stagger={stagger_ms}ms, capture_id={record.capture_id}, pair_id={record.pair_id}"
-    )
-    
-    return img1_path, img2_path, record.capture_id, record.pair_id
+    if subprocess_logger.isEnabledFor(_logging.INFO):
+        per_camera = ", ".join(f"cam{c.camera_index}={t:.3f}s" for c, t in zip(configs, times))
+        subprocess_logger.info(
+            "Parallel capture: %s, stagger=%sms, capture_id=%s, pair_id=%s",
+            per_camera, stagger_ms, record.capture_id, record.pair_id
+        )
     
+    return paths, record.capture_id, record.pair_id
+
+
 def capture_preview_frame(camera_index: int) -> bytes:
     """
     Capture a low-resolution preview frame and return JPEG bytes.
@@ -430,7 +1028,7 @@ def flush_preview_tmp() -> int:
     for f in _PREVIEW_TMP_DIR.glob(f"{_PREVIEW_PREFIX}*.jpg"):
         try:
             f.unlink(missing_ok=True)
-            subprocess_logger.info(f"Flushed stale preview temp file: {f}")
+            subprocess_logger.info("Flushed stale preview temp file: %s", f)
             count += 1
         except Exception as e:
             subprocess_logger.warning(f"Could not remove preview temp file {f}: {e}")
@@ -536,11 +1134,12 @@ def main():
     """
     try:
         # Check if cameras are connected
+        startup_camera_discovery()
         cam0_connected = is_camera_connected(0)
         cam1_connected = is_camera_connected(1)
         
-        subprocess_logger.info(f"Camera 0: {'Connected' if cam0_connected else 'Not connected'}")
-        subprocess_logger.info(f"Camera 1: {'Connected' if cam1_connected else 'Not connected'}")
+        subprocess_logger.info("Camera 0: %s", 'Connected' if cam0_connected else 'Not connected')
+        subprocess_logger.info("Camera 1: %s", 'Connected' if cam1_connected else 'Not connected')
         
         if not cam0_connected and not cam1_connected:
             subprocess_logger.error("No cameras detected!")
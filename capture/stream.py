@@ -0,0 +1,254 @@
+"""
+Continuous capture from persistent Picamera2 cameras.
+
+``dual_capture_image`` runs a full still capture (configure, AF/AE wait,
+encode) for every shot, which limits batch scanning to well under one pair
+per second. ``CaptureStream`` instead keeps each camera streaming and always
+holds the most recent frame, so taking a pair is just a read of two buffers
+plus JPEG encoding on the shared capture pool.
+"""
+
+import os
+import threading
+import time
+from typing import List, Optional
+
+from PIL import Image
+
+from .camera import CameraConfig
+from .manifestHandler import generate_manifest_record, append_manifest_record
+from . import service as _service
+from .service import (
+    PROJECTS_ROOT,
+    _image_dir,
+    _timestamp_index,
+    get_backend,
+    image_filename,
+    subprocess_logger,
+)
+
+
+class CaptureStream:
+    """
+    Stream frames from one or more cameras and snapshot the latest ones on demand.
+
+    A background thread per camera pulls frames continuously into a
+    single-slot buffer (newer frames replace older ones). Requires the
+    picamera2 backend; the cached Picamera2 instances of the backend are
+    reused, so no second libcamera connection is opened.
+
+    Example:
+        with CaptureStream([cam1, cam2]) as stream:
+            for page in pages:
+                path1, path2, capture_id, pair_id = stream.save_pair("myproject")
+    """
+
+    def __init__(self, configs: List[CameraConfig], first_frame_timeout: float = 5.0):
+        """
+        Configure and start all cameras, then begin pulling frames.
+
+        Args:
+            configs: One CameraConfig per camera to stream.
+            first_frame_timeout: Seconds to wait for every camera's first frame.
+
+        Raises:
+            RuntimeError: If the active backend is not picamera2 or a camera
+                does not deliver a frame in time.
+        """
+        backend = get_backend()
+        if not hasattr(backend, "_get_camera"):
+            raise RuntimeError("CaptureStream requires the picamera2 camera backend")
+
+        self._backend = backend
+        self._configs = list(configs)
+        self._cameras = []
+        self._frames: list = [None] * len(self._configs)
+        self._frame_ready = [threading.Event() for _ in self._configs]
+        self._frames_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads: List[threading.Thread] = []
+
+        try:
+            for config in self._configs:
+                self._cameras.append(self._start_camera(config))
+
+            for i, config in enumerate(self._configs):
+                thread = threading.Thread(
+                    target=self._grab_loop,
+                    args=(i,),
+                    name=f"stream-c{config.camera_index}",
+                    daemon=True,
+                )
+                thread.start()
+                self._threads.append(thread)
+
+            for i, ready in enumerate(self._frame_ready):
+                if not ready.wait(first_frame_timeout):
+                    raise RuntimeError(
+                        f"Camera {self._configs[i].camera_index} produced no frame "
+                        f"within {first_frame_timeout}s"
+                    )
+        except Exception:
+            # Stop whatever did start (e.g. the first camera when the second fails)
+            self.close()
+            raise
+
+    def _start_camera(self, config: CameraConfig):
+        """Configure *config*'s camera for continuous RGB streaming and start it."""
+        index = config.camera_index
+        with self._backend._get_camera_lock(index):
+            picam2 = self._backend._get_camera(index)
+            if picam2.started:
+                picam2.stop()
+
+            config_args = {
+                "main": {"size": config.img_size, "format": "RGB888"},
+                "buffer_count": config.buffer_count,
+            }
+            if config.hflip or config.vflip:
+                from libcamera import Transform
+                config_args["transform"] = Transform(
+                    hflip=int(config.hflip), vflip=int(config.vflip)
+                )
+            picam2.configure(picam2.create_still_configuration(**config_args))
+            picam2.start()
+
+            controls = self._backend._config_to_picamera2_controls(config)
+            if config.lens_position is not None:
+                controls["LensPosition"] = config.lens_position
+            if controls:
+                picam2.set_controls(controls)
+
+            # The backend's cached still configuration no longer matches.
+            self._backend._last_configs.pop(index, None)
+            self._backend._format_mode.pop(index, None)
+
+            subprocess_logger.info(
+                "Streaming camera %s at %sx%s", index, config.img_size[0], config.img_size[1]
+            )
+            return picam2
+
+    def _grab_loop(self, i: int) -> None:
+        """Keep slot *i* filled with the newest frame until the stream is closed."""
+        picam2 = self._cameras[i]
+        index = self._configs[i].camera_index
+        lock = self._backend._get_camera_lock(index)
+        while not self._stop.is_set():
+            try:
+                with lock:
+                    request = picam2.capture_request()
+                    try:
+                        array = request.make_array("main")
+                        metadata = request.get_metadata()
+                    finally:
+                        request.release()
+            except Exception as e:
+                subprocess_logger.warning("Stream frame failed for camera %s: %s", index, e)
+                self._stop.wait(0.1)
+                continue
+
+            with self._frames_lock:
+                self._frames[i] = (array, metadata)
+            self._frame_ready[i].set()
+
+    def snapshot(self) -> list:
+        """
+        Return the latest ``(array, metadata)`` frame of every camera.
+
+        Arrays are in picamera2's RGB888 layout (BGR byte order).
+        """
+        with self._frames_lock:
+            return list(self._frames)
+
+    def snapshot_pair(self) -> tuple:
+        """Return the latest frames of the first two cameras as ``(frame1, frame2)``."""
+        frames = self.snapshot()
+        if len(frames) < 2:
+            raise RuntimeError("snapshot_pair requires a stream with two cameras")
+        return frames[0], frames[1]
+
+    def save_pair(
+            self,
+            project_name: str,
+            include_resolution: bool = False,
+            collection_name: Optional[str] = None) -> tuple:
+        """
+        Save the latest frame pair to the project and append a manifest record.
+
+        Both frames are encoded in parallel on the capture pool.
+
+        Args:
+            project_name (str): The name of the project to save the images in.
+            include_resolution (bool): Include resolution in the filenames.
+            collection_name (str): Optional collection inside the project.
+        Returns:
+            tuple: (path1, path2, capture_id, pair_id), like ``dual_capture_image``.
+        """
+        frame1, frame2 = self.snapshot_pair()
+        config1, config2 = self._configs[0], self._configs[1]
+
+        timestamp_index = _timestamp_index(time.time_ns())
+        project_path = _image_dir(project_name, collection_name)
+
+        def encode(frame, config):
+            start = time.monotonic_ns()
+            array, _ = frame
+            path = f"{project_path}{os.sep}" + image_filename(
+                camera_index=config.camera_index,
+                index=timestamp_index,
+                img_size=config.img_size if include_resolution else None,
+                image_encoding=config.encoding
+            )
+            # RGB888 buffers are stored B, G, R; flip to RGB for PIL.
+            # Baseline JPEG without the extra Huffman optimisation pass, which
+            # costs encode time for a few percent of file size.
+            Image.fromarray(array[..., ::-1]).save(
+                path, quality=config.quality, optimize=False, progressive=False
+            )
+            return path, (time.monotonic_ns() - start) / 1e9
+
+        # Looked up on the module: the pool is replaced in forked children
+        future1 = _service._capture_pool.submit(encode, frame1, config1)
+        future2 = _service._capture_pool.submit(encode, frame2, config2)
+        path1, time1 = future1.result()
+        path2, time2 = future2.result()
+
+        metadata_list = [
+            self._backend._extract_archival_metadata(frame[1]) for frame in (frame1, frame2)
+        ]
+        record = generate_manifest_record(
+            project_name=project_name,
+            pair_id=timestamp_index,
+            img_paths=[path1, path2],
+            cam_configs=[config1, config2],
+            times=[time1, time2],
+            metadata_list=metadata_list,
+            defer_hashes=True  # hashed by the manifest writer
+        )
+        append_manifest_record(PROJECTS_ROOT / project_name, record)
+
+        subprocess_logger.info(
+            "Stream pair saved: cam%s=%.3fs, cam%s=%.3fs, capture_id=%s",
+            config1.camera_index, time1, config2.camera_index, time2, record.capture_id
+        )
+
+        return path1, path2, record.capture_id, record.pair_id
+
+    def close(self) -> None:
+        """Stop the grab threads and the cameras (instances stay cached in the backend)."""
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=2)
+        for config, picam2 in zip(self._configs, self._cameras):
+            with self._backend._get_camera_lock(config.camera_index):
+                try:
+                    if picam2.started:
+                        picam2.stop()
+                except Exception as e:
+                    subprocess_logger.warning("Error stopping stream camera %s: %s", config.camera_index, e)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
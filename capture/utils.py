@@ -1,6 +1,27 @@
+import atexit
+import concurrent.futures
 import hashlib
 import logging
-from logging.handlers import RotatingFileHandler
+import mmap
+import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# Optional: faster content hashes for manifests (MANIFEST_HASH=blake3)
+try:
+    import blake3
+except ImportError:
+    blake3 = None
+
+# Files up to SHA256_SMALL_FILE are read in one call, larger ones up to
+# SHA256_MMAP_MAX are hashed through mmap in a single update().
+SHA256_SMALL_FILE = 256 * 1024
+SHA256_MMAP_MAX = 64 * 1024 * 1024
+
+# posix_fadvise is Linux/Unix only (absent on macOS and Windows)
+_HAS_FADVISE = hasattr(os, "posix_fadvise")
+
 
 def compute_sha256(file_path: str) -> str:
     """
@@ -12,16 +33,135 @@ def compute_sha256(file_path: str) -> str:
     Returns:
         SHA256 hash as a hexadecimal string.
     """
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    with open(file_path, "rb", buffering=0) as f:
+        fd = f.fileno()
+        # Read ahead further for the sequential scan, and drop the pages
+        # afterwards so hashed captures don't crowd newer ones out of the
+        # page cache
+        if _HAS_FADVISE:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        try:
+            return _sha256_open_file(f)
+        finally:
+            if _HAS_FADVISE:
+                os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+def _sha256_open_file(f) -> str:
+    # Capture outputs fit in memory: map the file and hash it with one
+    # update(), so the page cache is hashed in place without copies
+    size = os.fstat(f.fileno()).st_size
+    # Thumbnails and previews: one read is cheaper than setting up a mapping
+    if size <= SHA256_SMALL_FILE:
+        return hashlib.sha256(f.read()).hexdigest()
+    if size <= SHA256_MMAP_MAX:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return hashlib.sha256(mapped).hexdigest()
+    # file_digest runs the read/update loop in C; unbuffered so it reads
+    # straight into its own buffer
+    return hashlib.file_digest(f, "sha256").hexdigest()
+
+
+def compute_blake3(file_path: str) -> str:
+    """
+    Compute BLAKE3 hash of a file (requires the blake3 package).
+    
+    The file is memory-mapped and hashed with BLAKE3's internal threads.
+    Args:
+        file_path: Path to the file.
+    Returns:
+        BLAKE3 hash as a hexadecimal string.
+    """
+    if blake3 is None:
+        raise RuntimeError("BLAKE3 hashing requires the blake3 package (pip install blake3)")
+    return blake3.blake3(max_threads=blake3.blake3.AUTO).update_mmap(file_path).hexdigest()
+
+
+HASH_FUNCTIONS = {
+    "sha256": compute_sha256,
+    "blake3": compute_blake3,
+}
+
+
+# Shared threads for hashing several files at once; hashlib releases the
+# GIL while hashing large blocks, so files are hashed on separate cores.
+_hash_pool = concurrent.futures.ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="sha256"
+)
+atexit.register(_hash_pool.shutdown)
+
+
+def compute_hashes_many(file_paths, algorithm: str = "sha256") -> dict:
+    """
+    Hash several files in parallel.
+    
+    Args:
+        file_paths: Iterable of file paths.
+        algorithm: A key of HASH_FUNCTIONS ("sha256" or "blake3").
+    Returns:
+        Dict mapping each path to its hash as a hexadecimal string.
+    """
+    hash_file = HASH_FUNCTIONS[algorithm]
+    file_paths = list(dict.fromkeys(file_paths))
+    if len(file_paths) == 1:
+        return {file_paths[0]: hash_file(file_paths[0])}
+    return dict(zip(file_paths, _hash_pool.map(hash_file, file_paths)))
+
+
+# One QueueHandler per log file, shared by every logger writing to it. The
+# RotatingFileHandler behind it runs on a QueueListener thread so callers
+# (e.g. the capture threads) only pay for a queue put, not for disk I/O.
+_queue_handlers: dict = {}
+_queue_handlers_lock = threading.Lock()
+
+# Loggers already set up, keyed by (log_file, logger_name), so repeated
+# setup_rotating_logger calls return straight away
+_LOGGER_CACHE: dict = {}
+
+# Shared by every log file; the format string is fixed, so skip validating it
+_LOG_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s', style='%', validate=False
+)
+
+
+class _InProcessQueueHandler(QueueHandler):
+    """
+    QueueHandler that enqueues records unformatted.
+    
+    The stock prepare() formats the message (and any traceback) on the
+    calling thread so records can be pickled; the queue here never leaves
+    the process, so formatting is left to the listener thread instead.
+    """
+    
+    def prepare(self, record):
+        return record
+
+
+def _get_queue_handler(log_file: str, max_bytes: int, backup_count: int) -> QueueHandler:
+    """Return (creating and starting if needed) the queue handler for *log_file*."""
+    with _queue_handlers_lock:
+        handler = _queue_handlers.get(log_file)
+        if handler is None:
+            file_handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
+            file_handler.setFormatter(_LOG_FORMATTER)
+
+            log_queue = queue.SimpleQueue()
+            handler = _InProcessQueueHandler(log_queue)
+            handler.log_file = log_file
+            listener = QueueListener(log_queue, file_handler, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            _queue_handlers[log_file] = handler
+        return handler
+
 
 def setup_rotating_logger(log_file: str, logger_name: str, level=logging.INFO, max_bytes=5*1024*1024, backup_count=5) -> logging.Logger:
     """
     Set up a rotating file logger.
     
+    Records are handed to a background thread through a queue, so emitting
+    a log line never blocks the caller on file writes or rotation.
+    
     Args:
         log_file: Path to the log file.
         logger_name: Name of the logger.
@@ -32,18 +172,20 @@ def setup_rotating_logger(log_file: str, logger_name: str, level=logging.INFO, m
     Returns:
         Configured logger instance.
     """
+    logger = _LOGGER_CACHE.get((log_file, logger_name))
+    if logger is not None:
+        return logger
+
     logger = logging.getLogger(logger_name)
     logger.setLevel(level)
 
     # Guard against duplicate handlers when the module is reimported by
     # uvicorn's auto-reloader (the logger singleton persists across reloads).
     if not any(
-        isinstance(h, RotatingFileHandler) and getattr(h, "baseFilename", None) == log_file
+        isinstance(h, QueueHandler) and getattr(h, "log_file", None) == log_file
         for h in logger.handlers
     ):
-        handler = RotatingFileHandler(log_file, maxBytes=max_bytes, backupCount=backup_count)
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_get_queue_handler(log_file, max_bytes, backup_count))
 
-    return logger
\ No newline at end of file
+    _LOGGER_CACHE[(log_file, logger_name)] = logger
+    return logger
@@ -178,6 +178,14 @@ def set_camera_backend(monkeypatch, camera_backend_type):
 
 
 # Pytest hooks
+def pytest_addoption(parser):
+    """Add --runslow (defined here, in the rootdir conftest, so it is always registered)."""
+    parser.addoption(
+        "--runslow", action="store_true", default=False,
+        help="also run tests marked slow (skipped by default)"
+    )
+
+
 def pytest_configure(config):
     """Configure pytest with custom markers."""
     config.addinivalue_line(
@@ -203,8 +211,15 @@ def pytest_collection_modifyitems(config, items):
     
     - Tests with "camera" in the name get @pytest.mark.camera
     - Tests with "slow" in the name get @pytest.mark.slow
+    - Tests marked slow are skipped unless --runslow is given
     """
+    skip_slow = None
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="slow test - use --runslow to run")
     for item in items:
+        if skip_slow and item.get_closest_marker("slow"):
+            item.add_marker(skip_slow)
+        
         # Auto-mark camera tests
         if "camera" in item.nodeid.lower():
             item.add_marker(pytest.mark.camera)
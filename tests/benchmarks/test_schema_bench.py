@@ -0,0 +1,56 @@
+"""
+Micro-benchmarks for constructing the API's Pydantic schemas.
+
+Run with (xdist disables benchmarking, so run them in one process; they are
+marked slow, hence --runslow), or use the pixi bench-save/bench-compare tasks:
+    pytest tests/benchmarks -n 0 --runslow --benchmark-only --benchmark-autosave
+Compare against the saved baseline and fail on a >10% slowdown:
+    pytest tests/benchmarks -n 0 --runslow --benchmark-only --benchmark-compare --benchmark-compare-fail=mean:10%
+"""
+
+import pytest
+
+pytest.importorskip("pytest_benchmark")
+
+pytestmark = pytest.mark.slow
+
+
+def test_record_create(benchmark):
+    from app.schemas.record import RecordCreate
+    
+    record = benchmark(
+        RecordCreate,
+        title="Test Record",
+        description="A test record",
+        object_typology="book",
+        author="John Doe",
+        material="paper",
+        date="2024-01-01",
+    )
+    assert record.object_typology == "book"
+
+
+def test_record_update(benchmark):
+    from app.schemas.record import RecordUpdate
+    
+    update = benchmark(
+        RecordUpdate,
+        title="Updated Title",
+        object_typology="document",
+        custom_attributes='{"custom": "value"}',
+    )
+    assert update.title == "Updated Title"
+
+
+def test_user_create(benchmark):
+    from app.schemas.user import UserCreate
+    
+    user = benchmark(UserCreate, username="testuser", email="test@example.com", password="pwd123")
+    assert user.username == "testuser"
+
+
+def test_project_create(benchmark):
+    from app.schemas.project import ProjectCreate
+    
+    project = benchmark(ProjectCreate, name="Test Project", description="A test project")
+    assert project.name == "Test Project"
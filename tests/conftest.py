@@ -8,12 +8,17 @@ import pytest
 import tempfile
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
 
 # Add backend directory to path (parent of tests directory)
 backend_dir = Path(__file__).parent.parent
 if str(backend_dir) not in sys.path:
     sys.path.insert(0, str(backend_dir))
 
+# Cheap password hashes for tests (production uses 100,000 iterations); set
+# before app.core.security reads the settings
+os.environ.setdefault("PASSWORD_HASH_ITERATIONS", "1000")
+
 
 @pytest.fixture(scope="session")
 def backend_root():
@@ -29,8 +34,21 @@ def test_data_dir(backend_root):
     return test_dir
 
 
+@pytest.fixture(scope="session")
+def session_project_skeleton(tmp_path_factory):
+    """
+    Build the project directory layout once per session.
+    
+    Files added to the skeleton are hard-linked (not copied) into each
+    test's project by temp_project_dir.
+    """
+    skeleton = tmp_path_factory.mktemp("skel") / "test_project"
+    (skeleton / "images" / "main").mkdir(parents=True)
+    return skeleton
+
+
 @pytest.fixture
-def temp_project_dir(tmp_path):
+def temp_project_dir(tmp_path, session_project_skeleton):
     """
     Create a temporary project directory for testing.
     
@@ -38,8 +56,7 @@ def temp_project_dir(tmp_path):
     cleaned up after the test completes.
     """
     project_dir = tmp_path / "test_project"
-    project_dir.mkdir(parents=True, exist_ok=True)
-    (project_dir / "images" / "main").mkdir(parents=True, exist_ok=True)
+    shutil.copytree(session_project_skeleton, project_dir, copy_function=os.link, dirs_exist_ok=True)
     return project_dir
 
 
@@ -101,19 +118,43 @@ def override_projects_root(tmp_path, monkeypatch):
     test_projects_dir = tmp_path / "test_projects"
     test_projects_dir.mkdir(parents=True, exist_ok=True)
     
-    # Patch the environment variable
+    # Patch the environment variable (for subprocesses) and the shared
+    # settings object in place; reloading app.core.config would create a new
+    # settings object that modules which already imported it never see
     monkeypatch.setenv("PROJECTS_ROOT", str(test_projects_dir))
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "PROJECTS_ROOT", str(test_projects_dir))
     
-    # Reload settings to pick up the new value
-    from app.core import config
-    import importlib
-    importlib.reload(config)
+    # Capture modules resolve the projects root once at import
+    for module_name in ("capture.service", "capture.stream", "capture.project_manager"):
+        module = sys.modules.get(module_name)
+        if module is not None:
+            monkeypatch.setattr(module, "PROJECTS_ROOT", test_projects_dir)
     
     return test_projects_dir
 
 
+@pytest.fixture(scope="session")
+def camera_availability():
+    """
+    Indices of the connected cameras, probed once per test session.
+    
+    Opening a camera to check for it takes hundreds of ms on picamera2, so
+    the skip fixtures below share this result instead of probing per test.
+    An unavailable camera backend counts as no cameras.
+    """
+    from capture import is_camera_connected
+    
+    try:
+        return frozenset(index for index in (0, 1) if is_camera_connected(index))
+    except RuntimeError as e:
+        if "requires Linux" in str(e) or "Picamera2Backend" in str(e):
+            return frozenset()
+        raise
+
+
 @pytest.fixture
-def skip_if_no_camera():
+def skip_if_no_camera(camera_availability):
     """
     Skip test if no cameras are detected.
     
@@ -122,14 +163,12 @@ def skip_if_no_camera():
             # Test will be skipped if no cameras found
             ...
     """
-    from capture import is_camera_connected
-    
-    if not is_camera_connected(0):
+    if 0 not in camera_availability:
         pytest.skip("No camera detected - skipping hardware test")
 
 
 @pytest.fixture
-def skip_if_single_camera():
+def skip_if_single_camera(camera_availability):
     """
     Skip test if fewer than 2 cameras are detected.
     
@@ -138,16 +177,8 @@ def skip_if_single_camera():
             # Test will be skipped if not enough cameras
             ...
     """
-    from capture import is_camera_connected
-    
-    try:
-        if not (is_camera_connected(0) and is_camera_connected(1)):
-            pytest.skip("Dual cameras not detected - skipping test")
-    except RuntimeError as e:
-        if "requires Linux" in str(e) or "Picamera2Backend" in str(e):
-            pytest.skip("Camera backend not available on this platform - skipping test")
-        else:
-            raise
+    if not {0, 1} <= camera_availability:
+        pytest.skip("Dual cameras not detected - skipping test")
 
 
 @pytest.fixture(params=["subprocess", "picamera2"])
@@ -175,11 +206,8 @@ def set_camera_backend(monkeypatch, camera_backend_type):
             ...
     """
     monkeypatch.setenv("CAMERA_BACKEND", camera_backend_type)
-    
-    # Reload settings
-    from app.core import config
-    import importlib
-    importlib.reload(config)
+    from app.core.config import settings
+    monkeypatch.setattr(settings, "CAMERA_BACKEND", camera_backend_type)
     
     return camera_backend_type
 
@@ -202,6 +230,9 @@ def pytest_configure(config):
     config.addinivalue_line(
         "markers", "backend: mark test as camera backend specific"
     )
+    config.addinivalue_line(
+        "markers", "serial: mark test as using camera hardware (not run under xdist)"
+    )
 
 
 def pytest_collection_modifyitems(config, items):
@@ -210,19 +241,55 @@ def pytest_collection_modifyitems(config, items):
     
     - Tests with "camera" in the name get @pytest.mark.camera
     - Tests with "slow" in the name get @pytest.mark.slow
+    - Camera tests also get @pytest.mark.serial, so parallel runs
+      (pytest -n auto -m "not serial") leave the devices to a serial pass
+    - Under xdist (--dist=loadgroup) each file is one group, so its module
+      fixtures are built once, and all serial tests share the "serial" group
+      so only one worker touches the cameras
     """
+    group_by_xdist = config.pluginmanager.hasplugin("xdist")
     for item in items:
         # Auto-mark camera tests
         if "camera" in item.nodeid.lower():
             item.add_marker(pytest.mark.camera)
         
+        if item.get_closest_marker("camera"):
+            item.add_marker(pytest.mark.serial)
+        
         # Auto-mark backend tests
         if "backend" in item.nodeid.lower():
             item.add_marker(pytest.mark.backend)
+        
+        if group_by_xdist:
+            group = "serial" if item.get_closest_marker("serial") else item.nodeid.split("::", 1)[0]
+            item.add_marker(pytest.mark.xdist_group(group))
 
 
 # ==================== Database Fixtures ====================
 
+@pytest.fixture(scope="session")
+def test_engine():
+    """
+    Session-wide in-memory SQLite engine with every model's table created.
+    
+    StaticPool keeps the single in-memory connection alive (and shared across
+    threads) for the whole session. Use it for schema checks that don't write.
+    """
+    from sqlalchemy import create_engine
+    from sqlalchemy.pool import StaticPool
+    from app.core.db import Base
+    from app.models import camera, collection, project, project_member, record, system_log, user
+    
+    engine = create_engine(
+        "sqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
 @pytest.fixture
 def db_session(override_projects_root):
     """
@@ -253,13 +320,83 @@ def db_session(override_projects_root):
     Path(temp_db.name).unlink(missing_ok=True)
 
 
-@pytest.fixture
-def client(db_session):
+@pytest.fixture(scope="session")
+def app_modules():
+    """
+    Security helpers and API schemas, imported once per session (per xdist worker).
+    
+    Usage:
+        def test_hashing(app_modules):
+            hashed = app_modules.hash_password("secret")
+            ...
+    """
+    from app.core.security import (
+        hash_password, verify_password,
+        create_access_token, verify_access_token
+    )
+    from app.schemas.user import UserCreate, PasswordReset
+    from app.schemas.project import ProjectCreate, ProjectUpdate
+    from app.schemas.record import RecordCreate, RecordUpdate
+    from app.schemas.camera import CameraSettingsUpdate
+    
+    return SimpleNamespace(
+        hash_password=hash_password,
+        verify_password=verify_password,
+        create_access_token=create_access_token,
+        verify_access_token=verify_access_token,
+        UserCreate=UserCreate,
+        PasswordReset=PasswordReset,
+        ProjectCreate=ProjectCreate,
+        ProjectUpdate=ProjectUpdate,
+        RecordCreate=RecordCreate,
+        RecordUpdate=RecordUpdate,
+        CameraSettingsUpdate=CameraSettingsUpdate,
+    )
+
+
+@pytest.fixture(scope="session")
+def api_client():
     """
-    Create a test client for API endpoints.
+    TestClient for the FastAPI app, created once per session (per xdist worker).
+    
+    The app's lifespan (init_db and camera discovery) is not run; tests get
+    their database through the client fixture's dependency override.
     """
     from fastapi.testclient import TestClient
-    from app.main import app
+    try:
+        from app.main import app
+    except ImportError as e:
+        if "pq wrapper" in str(e) or "psycopg" in str(e):
+            pytest.skip("app.main import skipped - database not available on this platform")
+        raise
+    return TestClient(app)
+
+
+@pytest.fixture(scope="session")
+def route_map():
+    """
+    Route paths of the FastAPI app (app.state.path_index, built when app.main is imported).
+    
+    Usage:
+        def test_capture_route(route_map):
+            assert "/cameras/capture" in route_map
+    """
+    if sys.platform != 'linux':
+        pytest.skip("Route registration tests require Linux/Raspberry Pi environment")
+    try:
+        from app.main import app
+    except ImportError as e:
+        if "pq wrapper" in str(e) or "psycopg" in str(e):
+            pytest.skip("app.main import skipped - database not available on this platform")
+        raise
+    return app.state.path_index
+
+
+@pytest.fixture
+def client(db_session, api_client):
+    """
+    Test client for API endpoints, backed by the test's database session.
+    """
     from app.api.deps import get_db_dependency
     
     def override_get_db():
@@ -268,12 +405,14 @@ def client(db_session):
         finally:
             pass
     
+    app = api_client.app
     app.dependency_overrides[get_db_dependency] = override_get_db
     
-    client = TestClient(app)
-    yield client
+    yield api_client
     
     app.dependency_overrides.clear()
+    # The client is shared, so don't carry cookies over to the next test
+    api_client.cookies.clear()
 
 
 @pytest.fixture
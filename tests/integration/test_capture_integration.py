@@ -13,6 +13,9 @@ if sys.platform != 'linux':
     pytest.skip("Integration tests require Linux/Raspberry Pi environment", allow_module_level=True)
 
 
+# Every test here triggers a real capture through the API
+pytestmark = pytest.mark.serial
+
 from app.models.record import Record, RecordImage, ExifData
 from app.models.camera import CameraSettings
 from app.models.project import Project
@@ -1,302 +1,253 @@
 #!/usr/bin/env python3
 """
-Minimal test script to validate API endpoints and routes.
-This script tests the core functionality without requiring a running server.
-Run with: python -m pytest tests/unit/test_api.py
+Minimal tests to validate API endpoints and routes.
+These test the core functionality without requiring a running server.
+Run with: python -m pytest tests/unit/test_api.py --runslow
 """
 
+import hashlib
+import importlib
 import sys
-import os
+import time
 import pytest
+from sqlalchemy import inspect
 
-def test_imports():
-    """Test that all modules can be imported without errors."""
-    print("Testing imports...")
-    try:
-        from app.core.config import settings
-        from app.core.security import (
-            hash_password, verify_password,
-            create_access_token, verify_access_token
-        )
-        from app.schemas.user import UserCreate, UserRead, PasswordReset
-        from app.schemas.project import ProjectCreate, ProjectRead
-        from app.schemas.record import RecordCreate, RecordRead, RecordUpdate
-        from app.schemas.camera import CameraSettingsRead, CameraSettingsCreate
-        from app.api.auth import router as auth_router, get_current_user
-        from app.api.records import router as records_router
-        from app.api.projects import router as projects_router
-        from app.api.cameras import router as cameras_router
-        
-        # Try importing app.main (may fail due to database)
-        try:
-            from app.main import app
-            print(" [OK] All imports successful")
-        except ImportError as app_e:
-            if "pq wrapper" in str(app_e) or "psycopg" in str(app_e):
-                print(" [OK] Core imports successful (app.main import skipped - database not available on this platform)")
-            else:
-                raise
-        
-        # Try database imports (may fail on non-Linux)
-        try:
-            from app.core.db import Base, engine, init_db
-            from app.models.user import User
-            from app.models.project import Project
-            from app.models.record import Record, RecordImage, ExifData
-            from app.models.camera import CameraSettings
-            print(" [OK] All imports successful (including database)")
-        except ImportError as db_e:
-            if "pq wrapper" in str(db_e) or "psycopg" in str(db_e):
-                print(" [OK] Core imports successful (database imports skipped - not available on this platform)")
-            else:
-                raise
-        
-        return True
-    except Exception as e:
-        print(f"✗ Import failed: {e}")
-        return False
-
-
-def test_password_hashing():
-    """Test password hashing and verification."""
-    print("\nTesting password hashing...")
-    try:
-        from app.core.security import hash_password, verify_password
-        
-        password = "test_password_123"
-        hashed = hash_password(password)
-        
-        assert verify_password(password, hashed), "Password verification failed"
-        assert not verify_password("wrong_password", hashed), "Wrong password should not verify"
-        
-        print(" [OK] Password hashing works correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Password hashing test failed: {e}")
-        return False
-
-
-def test_token_generation():
-    """Test token creation and verification."""
-    print("\nTesting token generation and verification...")
-    try:
-        from app.core.security import create_access_token, verify_access_token
-        import time
-        
-        token = create_access_token(subject="user_123")
-        assert token, "Token should not be empty"
-        
-        payload = verify_access_token(token)
-        assert payload is not None, "Token verification failed"
-        assert payload.get("sub") == "user_123", "Subject mismatch"
-        
-        # Test expired token
-        expired_token = create_access_token(subject="user_123", expires_seconds=0)
-        time.sleep(1)
-        expired_payload = verify_access_token(expired_token)
-        assert expired_payload is None, "Expired token should not verify"
-        
-        print(" [OK] Token generation and verification works correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Token test failed: {e}")
-        return False
-
-
-def test_schemas():
-    """Test that Pydantic schemas validate correctly."""
-    print("\nTesting Pydantic schemas...")
-    try:
-        from app.schemas.user import UserCreate, PasswordReset
-        from app.schemas.project import ProjectCreate
-        from app.schemas.record import RecordCreate, RecordUpdate
-        
-        # Test user creation
-        user = UserCreate(username="testuser", email="test@example.com", password="pwd123")
-        assert user.username == "testuser"
-        
-        # Test project creation
-        project = ProjectCreate(name="Test Project", description="A test project")
-        assert project.name == "Test Project"
-        
-        # Test record creation with typology
-        doc = RecordCreate(
-            title="Test Record",
-            description="A test record",
-            object_typology="book",
-            author="John Doe",
-            material="paper",
-            date="2024-01-01"
-        )
-        assert doc.object_typology == "book"
-        assert doc.author == "John Doe"
-        
-        # Test record update
-        doc_update = RecordUpdate(
-            title="Updated Title",
-            object_typology="document",
-            custom_attributes='{"custom": "value"}'
-        )
-        assert doc_update.title == "Updated Title"
-        
-        print(" [OK] Schema validation works correctly")
-        return True
-    except Exception as e:
-        print(f"✗ Schema test failed: {e}")
-        return False
-
-
-def test_routes():
-    """Test that all routes are registered."""
+pytestmark = pytest.mark.unit
+
+
+def _is_db_driver_error(e: ImportError) -> bool:
+    return "pq wrapper" in str(e) or "psycopg" in str(e)
+
+
+@pytest.fixture(scope="module")
+def app():
+    """The FastAPI app, imported once for the whole module."""
     if sys.platform != 'linux':
         pytest.skip("Route registration tests require Linux/Raspberry Pi environment")
-
-    print("\nTesting route registration...")
     try:
         from app.main import app
-        
-        routes = {route.path: route.methods for route in app.routes}
-        
-        # Check auth routes
-        assert "/auth/register" in routes, "Auth register route missing"
-        assert "/auth/login" in routes, "Auth login route missing"
-        assert "/auth/refresh" in routes, "Auth refresh route missing"
-        assert "/auth/password-reset" in routes, "Auth password reset route missing"
-        
-        # Check records routes
-        assert "/records/" in routes, "Records list route missing"
-        assert "/records/{record_id}" in routes, "Records get route missing"
-        assert "/records/upload" in routes, "Records upload route missing"
-        assert "/records/{record_id}/file" in routes, "Records file download route missing"
-        
-        # Check projects routes
-        assert "/projects/" in routes, "Projects list route missing"
-        assert "/projects/{project_id}" in routes, "Projects get route missing"
-        assert "/projects/{project_id}/initialize" in routes, "Projects initialize route missing"
-        assert "/projects/{project_id}/records" in routes, "Projects records route missing"
-        
-        # Check cameras routes
-        assert "/cameras/" in routes, "Cameras list route missing"
-        assert "/cameras/devices" in routes, "Cameras devices route missing"
-        assert "/cameras/capture" in routes, "Cameras capture route missing"
-        assert "/cameras/capture/dual" in routes, "Cameras dual capture route missing"
-        assert "/cameras/calibrate" in routes, "Cameras calibrate route missing"
-        assert "/cameras/calibrate/white-balance" in routes, "Cameras WB calibrate route missing"
-        assert "/cameras/settings/{id}" in routes, "Cameras settings CRUD routes missing"
-        
-        # Check health route
-        assert "/health" in routes, "Health check route missing"
-        
-        print(" [OK] All required routes are registered")
-        return True
-    except AssertionError as e:
-        print(f"✗ Route test failed: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ Route test error: {e}")
-        return False
-
-
-def test_models():
-    """Test that database models can be created."""
+    except ImportError as e:
+        if _is_db_driver_error(e):
+            pytest.skip("app.main import skipped - database not available on this platform")
+        raise
+    return app
+
+
+@pytest.fixture(scope="module")
+def db_base():
+    """SQLAlchemy Base with every model module imported (and so registered)."""
     if sys.platform != 'linux':
         pytest.skip("Model registration tests require Linux/Raspberry Pi environment")
-
-    print("\nTesting model creation...")
     try:
-        from app.core.db import Base, engine
+        from app.core.db import Base
         from app.models.user import User
         from app.models.project import Project
-        from app.models.record import Record, RecordImage
+        from app.models.record import Record, RecordImage, ExifData
         from app.models.camera import CameraSettings
-        
-        # Check that models are registered with Base
-        table_names = {table.name for table in Base.metadata.tables.values()}
-        
-        assert "users" in table_names, "Users table not registered"
-        assert "projects" in table_names, "Projects table not registered"
-        assert "document_images" in table_names, "Document images table not registered"
-        
-        print(" [OK] All models are properly registered")
-        return True
-    except AssertionError as e:
-        print(f"✗ Model test failed: {e}")
-        return False
-    except Exception as e:
-        print(f"✗ Model test error: {e}")
-        return False
-
-
-def test_new_endpoints():
-    """Test newly added endpoint schemas and models."""
-    print("\nTesting new endpoint schemas...")
-    try:
-        # Test camera schemas
-        from app.schemas.camera import CameraSettingsUpdate
-        cam_update = CameraSettingsUpdate(iso=400, white_balance="daylight")
-        assert cam_update.iso == 400
-        assert cam_update.white_balance == "daylight"
-        
-        # Test project schemas
-        from app.schemas.project import ProjectUpdate
-        proj_update = ProjectUpdate(name="Updated Name", description="New description")
-        assert proj_update.name == "Updated Name"
-        
-        # Partial updates should work
-        partial_update = ProjectUpdate(description="Only description")
-        assert partial_update.name is None
-        assert partial_update.description == "Only description"
-        
-        print(" [OK] New endpoint schemas work correctly")
-        return True
-    except Exception as e:
-        print(f"✗ New endpoint test failed: {e}")
-        return False
-
-
-@pytest.mark.unit
-def test_api_imports_pytest():
-    """Pytest version of import test."""
-    if sys.platform != 'linux':
-        pytest.skip("Database imports not available on non-Linux platforms")
-    assert test_imports()
-
-
-@pytest.mark.unit
-def test_api_password_pytest():
-    """Pytest version of password test."""
-    assert test_password_hashing()
+    except ImportError as e:
+        if _is_db_driver_error(e):
+            pytest.skip("Database imports skipped - not available on this platform")
+        raise
+    return Base
+
+
+# Modules the app is built from, and the names each must provide
+REQUIRED_IMPORTS = {
+    "app.core.config": ("settings",),
+    "app.core.security": ("hash_password", "verify_password", "create_access_token", "verify_access_token"),
+    "app.core.db": ("Base", "engine", "init_db"),
+    "app.models.user": ("User",),
+    "app.models.project": ("Project",),
+    "app.models.record": ("Record", "RecordImage", "ExifData"),
+    "app.models.camera": ("CameraSettings",),
+    "app.schemas.user": ("UserCreate", "UserRead", "PasswordReset"),
+    "app.schemas.project": ("ProjectCreate", "ProjectRead"),
+    "app.schemas.record": ("RecordCreate", "RecordRead", "RecordUpdate"),
+    "app.schemas.camera": ("CameraSettingsRead", "CameraSettingsCreate"),
+    "app.api.auth": ("router", "get_current_user"),
+    "app.api.records": ("router",),
+    "app.api.projects": ("router",),
+    "app.api.cameras": ("router",),
+    "app.main": ("app",),
+}
+
+
+@pytest.mark.slow
+def test_imports():
+    """Test that all modules can be imported without errors."""
+    for module_name, names in REQUIRED_IMPORTS.items():
+        try:
+            module = importlib.import_module(module_name)
+        except ImportError as e:
+            if _is_db_driver_error(e):
+                pytest.skip(f"{module_name} import skipped - database not available on this platform")
+            raise
+        for name in names:
+            assert hasattr(module, name), f"cannot import name '{name}' from '{module_name}'"
 
 
-@pytest.mark.unit
-def test_api_tokens_pytest():
-    """Pytest version of token test."""
-    assert test_token_generation()
+def test_password_hashing(app_modules):
+    """Test password hashing and verification."""
+    password = "test_password_123"
+    hashed = app_modules.hash_password(password)
 
+    assert app_modules.verify_password(password, hashed), "Password verification failed"
+    assert not app_modules.verify_password("wrong_password", hashed), "Wrong password should not verify"
 
-@pytest.mark.unit
-def test_api_schemas_pytest():
-    """Pytest version of schemas test."""
-    assert test_schemas()
 
+def test_token_generation(app_modules, monkeypatch):
+    """Test token creation and verification."""
+    create_access_token = app_modules.create_access_token
+    verify_access_token = app_modules.verify_access_token
+
+    token = create_access_token(subject="user_123")
+    assert token, "Token should not be empty"
+
+    payload = verify_access_token(token)
+    assert payload is not None, "Token verification failed"
+    assert payload.get("sub") == "user_123", "Subject mismatch"
+
+    # Test expired token: move security's clock forward instead of sleeping
+    expired_token = create_access_token(subject="user_123", expires_seconds=1)
+    now = time.time()
+    monkeypatch.setattr("app.core.security._now", lambda: now + 2)
+    expired_payload = verify_access_token(expired_token)
+    assert expired_payload is None, "Expired token should not verify"
+
+
+def test_password_hash_formats(app_modules, monkeypatch):
+    """Stored hashes from before and after configurable iterations both verify."""
+    from app.core import security
+
+    # "salt$hash" written before the iteration count was stored: 100,000 iterations
+    salt = "0123456789abcdef0123456789abcdef"
+    dk = hashlib.pbkdf2_hmac("sha256", b"legacy_password", salt.encode("utf-8"), 100_000)
+    legacy = f"{salt}${dk.hex()}"
+    assert app_modules.verify_password("legacy_password", legacy)
+    assert not app_modules.verify_password("wrong_password", legacy)
+
+    # The default count still produces the legacy two-part format
+    monkeypatch.setattr(security, "PASSWORD_HASH_ITERATIONS", 100_000)
+    assert app_modules.hash_password("pwd").count("$") == 1
+
+    # Any other count is stored in front of the salt
+    monkeypatch.setattr(security, "PASSWORD_HASH_ITERATIONS", 1234)
+    hashed = app_modules.hash_password("pwd")
+    iterations, salt, hash_hex = hashed.split("$")
+    assert iterations == "1234"
+    assert hash_hex == hashlib.pbkdf2_hmac("sha256", b"pwd", salt.encode("utf-8"), 1234).hex()
+    assert app_modules.verify_password("pwd", hashed)
+    assert not app_modules.verify_password("other", hashed)
+
+    # Verifying uses the stored count, not the current setting
+    monkeypatch.setattr(security, "PASSWORD_HASH_ITERATIONS", 1000)
+    assert app_modules.verify_password("pwd", hashed)
+
+
+@pytest.mark.parametrize("stored", [
+    "",
+    "nodollar",
+    "abc$def$ghi",          # non-integer iteration count
+    "0$salt$00",            # iteration count must be positive
+    "-5$salt$00",
+    "1000$salt$00$extra",   # too many parts
+    "salt$h\u00e9x",        # non-ASCII hash
+])
+def test_verify_password_malformed(app_modules, stored):
+    """Malformed stored hashes don't verify, and don't raise."""
+    assert app_modules.verify_password("pwd", stored) is False
+
+
+def test_schemas(app_modules):
+    """Test that Pydantic schemas validate correctly."""
+    # Test user creation
+    user = app_modules.UserCreate(username="testuser", email="test@example.com", password="pwd123")
+    assert user.username == "testuser"
+
+    # Test project creation
+    project = app_modules.ProjectCreate(name="Test Project", description="A test project")
+    assert project.name == "Test Project"
+
+    # Test record creation with typology
+    doc = app_modules.RecordCreate(
+        title="Test Record",
+        description="A test record",
+        object_typology="book",
+        author="John Doe",
+        material="paper",
+        date="2024-01-01"
+    )
+    assert doc.object_typology == "book"
+    assert doc.author == "John Doe"
+
+    # Test record update
+    doc_update = app_modules.RecordUpdate(
+        title="Updated Title",
+        object_typology="document",
+        custom_attributes='{"custom": "value"}'
+    )
+    assert doc_update.title == "Updated Title"
+
+
+def test_routes(route_map):
+    """Test that all routes are registered."""
+    # Check auth routes
+    assert "/auth/register" in route_map, "Auth register route missing"
+    assert "/auth/login" in route_map, "Auth login route missing"
+    assert "/auth/refresh" in route_map, "Auth refresh route missing"
+    assert "/auth/password-reset" in route_map, "Auth password reset route missing"
+
+    # Check records routes
+    assert "/records/" in route_map, "Records list route missing"
+    assert "/records/{record_id}" in route_map, "Records get route missing"
+    assert "/records/upload" in route_map, "Records upload route missing"
+    assert "/records/{record_id}/file" in route_map, "Records file download route missing"
+
+    # Check projects routes
+    assert "/projects/" in route_map, "Projects list route missing"
+    assert "/projects/{project_id}" in route_map, "Projects get route missing"
+    assert "/projects/{project_id}/initialize" in route_map, "Projects initialize route missing"
+    assert "/projects/{project_id}/records" in route_map, "Projects records route missing"
+
+    # Check cameras routes
+    assert "/cameras/" in route_map, "Cameras list route missing"
+    assert "/cameras/devices" in route_map, "Cameras devices route missing"
+    assert "/cameras/capture" in route_map, "Cameras capture route missing"
+    assert "/cameras/capture/dual" in route_map, "Cameras dual capture route missing"
+    assert "/cameras/calibrate" in route_map, "Cameras calibrate route missing"
+    assert "/cameras/calibrate/white-balance" in route_map, "Cameras WB calibrate route missing"
+    assert "/cameras/settings/{id}" in route_map, "Cameras settings CRUD routes missing"
+
+    # Check health route
+    assert "/health" in route_map, "Health check route missing"
+
+
+def test_models(db_base, test_engine):
+    """Test that database models can be created."""
+    # Check that the models' tables were created from Base
+    table_names = set(inspect(test_engine).get_table_names())
 
-@pytest.mark.unit
-def test_api_routes_pytest():
-    """Pytest version of routes test."""
-    assert test_routes()
+    assert "users" in table_names, "Users table not registered"
+    assert "projects" in table_names, "Projects table not registered"
+    assert "document_images" in table_names, "Document images table not registered"
 
 
-@pytest.mark.unit
-def test_api_models_pytest():
-    """Pytest version of models test."""
-    assert test_models()
+def test_new_endpoints(app_modules):
+    """Test newly added endpoint schemas and models."""
+    # Test camera schemas
+    cam_update = app_modules.CameraSettingsUpdate(iso=400, white_balance="daylight")
+    assert cam_update.iso == 400
+    assert cam_update.white_balance == "daylight"
 
+    # Test project schemas
+    proj_update = app_modules.ProjectUpdate(name="Updated Name", description="New description")
+    assert proj_update.name == "Updated Name"
 
-@pytest.mark.unit
-def test_api_endpoints_pytest():
-    """Pytest version of endpoints test."""
-    assert test_new_endpoints()
+    # Partial updates should work
+    partial_update = app_modules.ProjectUpdate(description="Only description")
+    assert partial_update.name is None
+    assert partial_update.description == "Only description"
 
 
 if __name__ == "__main__":
-    pytest.main([__file__, "-v"])
+    pytest.main([__file__, "-v", "-p", "no:cacheprovider"])
@@ -0,0 +1,396 @@
+"""
+Unit tests for the capture package that need no camera hardware.
+"""
+
+import dataclasses
+import logging
+import threading
+
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+def test_rpicam_is_camera_connected_without_binary(monkeypatch, tmp_path):
+    """A missing rpicam-still means "not connected", not an exception."""
+    from capture.backends import subprocess_backend
+    
+    monkeypatch.setattr(subprocess_backend, "_rpicam_still", lambda: str(tmp_path / "rpicam-still"))
+    backend = subprocess_backend.RpicamBackend(logging.getLogger("test_capture"))
+    
+    assert backend.is_camera_connected(0) is False
+    assert backend.list_cameras() is None
+
+
+class _Record:
+    """Minimal stand-in for a CaptureRecord."""
+    
+    def __init__(self, capture_id, fail=False):
+        self.capture_id = capture_id
+        self.fail = fail
+    
+    def to_dict(self):
+        if self.fail:
+            raise TypeError("cannot serialise")
+        return {"capture_id": self.capture_id}
+
+
+def test_manifest_writer_survives_failing_record(tmp_path, monkeypatch):
+    """A record that fails to serialise is skipped; the writer keeps going."""
+    from capture import manifestHandler
+    
+    manifestHandler.append_manifest_record(tmp_path, _Record("bad", fail=True))
+    manifestHandler.append_manifest_record(tmp_path, _Record("good"))
+    assert manifestHandler.flush_manifest(timeout=5)
+    
+    manifest = (tmp_path / "metadata" / "manifest.jsonl").read_text()
+    assert '"good"' in manifest and '"bad"' not in manifest
+    
+    # Even a failure outside serialisation releases flush_manifest()
+    def broken_batch(batch):
+        raise RuntimeError("boom")
+    monkeypatch.setattr(manifestHandler, "_write_manifest_batch", broken_batch)
+    manifestHandler.append_manifest_record(tmp_path, _Record("lost"))
+    assert manifestHandler.flush_manifest(timeout=5)
+    monkeypatch.undo()
+    
+    manifestHandler.append_manifest_record(tmp_path, _Record("after"))
+    assert manifestHandler.flush_manifest(timeout=5)
+    assert '"after"' in (tmp_path / "metadata" / "manifest.jsonl").read_text()
+
+
+def test_get_stagger_ms_never_calibrates(tmp_path, monkeypatch):
+    """An uncalibrated pair gets the default; calibration only runs when asked."""
+    from capture import service
+    from capture.camera import CameraConfig
+    
+    calls = []
+    monkeypatch.setattr(service, "STAGGER_CALIBRATION_FILE", tmp_path / "stagger_calibration.json")
+    monkeypatch.setattr(service, "_stagger_cache", {})
+    # The real key names the backend, which needs camera software installed
+    monkeypatch.setattr(service, "_stagger_key", lambda a, b: f"test:{a.camera_index}-{b.camera_index}")
+    monkeypatch.setattr(service, "calibrate_stagger", lambda a, b: calls.append((a, b)))
+    cam0, cam1 = CameraConfig(camera_index=0), CameraConfig(camera_index=1)
+    
+    assert service.get_stagger_ms(cam0, cam1) == service.DEFAULT_STAGGER_MS
+    assert not calls
+    
+    service.calibrate_missing_staggers(cam0, cam1)
+    assert calls == [(cam0, cam1)]
+    
+    # A stored value is used as is, and not recalibrated
+    (tmp_path / "stagger_calibration.json").write_text('{"test:0-1": 5}')
+    assert service.get_stagger_ms(cam0, cam1) == 5
+    service.calibrate_missing_staggers(cam0, cam1)
+    assert len(calls) == 1
+
+
+def _expected_argv(config):
+    """rpicam-still argv (no output path), assembled option by option in the original order."""
+    cmd = [
+        "rpicam-still",
+        "--width", str(config.img_size[0]),
+        "--height", str(config.img_size[1]),
+        "--quality", str(config.quality),
+        "--awb", config.awb,
+        "--buffer-count", str(config.buffer_count),
+        "--camera", str(config.camera_index),
+    ]
+    cmd += ["--immediate"] if config.timeout == 0 else ["-t", str(config.timeout)]
+    if config.nopreview:
+        cmd.append("-n")
+    if config.vflip:
+        cmd.append("--vflip")
+    if config.hflip:
+        cmd.append("--hflip")
+    if config.autofocus_on_capture:
+        cmd.append("--autofocus-on-capture")
+    if config.thumbnail:
+        cmd += ["--thumb", "320:240:70"]
+    if config.zsl:
+        cmd.append("--zsl")
+    if config.lens_position is not None:
+        cmd += ["--lens-position", str(config.lens_position)]
+    if config.encoding != "jpg":
+        cmd += ["--encoding", config.encoding]
+    if config.raw:
+        cmd.append("--raw")
+    if config.sync_role:
+        cmd += ["--sync", config.sync_role]
+    return cmd
+
+
+_FLAGS = ("nopreview", "vflip", "hflip", "autofocus_on_capture", "thumbnail", "zsl", "raw")
+
+
+@pytest.mark.parametrize("bits", range(1 << len(_FLAGS)))
+def test_camera_argv(bits, tmp_path):
+    """Every flag combination builds the same argv as the option-by-option builder."""
+    from capture.camera import CameraConfig, CameraConfigs
+    
+    flags = {name: bool(bits >> i & 1) for i, name in enumerate(_FLAGS)}
+    configs = [
+        CameraConfig(camera_index=0, **flags),
+        CameraConfig(camera_index=1, timeout=0, lens_position=2.5, encoding="png", sync_role="server", **flags),
+    ]
+    for config in configs:
+        assert list(config._cached_cmd) == _expected_argv(config)
+        assert list(config._build_rpicam_command()) == _expected_argv(config)
+    
+    # The output path now goes last rather than right after the program name
+    paths = [tmp_path / "a.jpg", tmp_path / "b.png"]
+    commands = CameraConfigs.from_configs(configs).build_commands(paths)
+    for config, path, command in zip(configs, paths, commands):
+        assert list(command) == _expected_argv(config) + ["-o", str(path)]
+
+
+def test_camera_cached_cmd_follows_mutation():
+    """Changing a config after building its command doesn't return the old command."""
+    from capture.camera import CameraConfig
+    
+    config = CameraConfig(camera_index=0)
+    before = config._cached_cmd
+    
+    config.vflip = True
+    config.awb = "daylight"
+    config.img_size = (2312, 1736)
+    config.lens_position = 1.0
+    after = config._cached_cmd
+    
+    assert after != before
+    assert list(after) == _expected_argv(config)
+    
+    # A new config with the original settings still gets the original argv
+    assert CameraConfig(camera_index=0)._cached_cmd == before
+    assert dataclasses.replace(config, vflip=False)._cached_cmd != after
+
+
+def test_compute_sha256_thresholds(tmp_path, monkeypatch):
+    """Each hashing path (single read, mmap, file_digest) matches hashlib.sha256."""
+    import hashlib
+    import os
+    from capture import utils
+    
+    # Shrink the thresholds so every path is covered with small files
+    small, mmap_max = 64, 256
+    monkeypatch.setattr(utils, "SHA256_SMALL_FILE", small)
+    monkeypatch.setattr(utils, "SHA256_MMAP_MAX", mmap_max)
+    # Record which path hashed each file
+    used = []
+    real_mmap, real_file_digest = utils.mmap.mmap, hashlib.file_digest
+    monkeypatch.setattr(utils.mmap, "mmap", lambda *a, **kw: used.append("mmap") or real_mmap(*a, **kw))
+    monkeypatch.setattr(hashlib, "file_digest", lambda *a: used.append("file_digest") or real_file_digest(*a))
+    
+    # mmap can't map an empty file, so size 0 must take the single read
+    expected_paths = {
+        0: "read", 1: "read", small - 1: "read", small: "read",
+        small + 1: "mmap", mmap_max: "mmap",
+        mmap_max + 1: "file_digest", 4 * mmap_max + 3: "file_digest",
+    }
+    for size, expected_path in expected_paths.items():
+        data = os.urandom(size)
+        path = tmp_path / f"{size}.bin"
+        path.write_bytes(data)
+        used.clear()
+        assert utils.compute_sha256(str(path)) == hashlib.sha256(data).hexdigest(), size
+        assert (used or ["read"]) == [expected_path], size
+    
+    # The real thresholds, on either side of each boundary
+    monkeypatch.undo()
+    for size in (utils.SHA256_SMALL_FILE, utils.SHA256_SMALL_FILE + 1):
+        data = os.urandom(size)
+        path = tmp_path / f"real_{size}.bin"
+        path.write_bytes(data)
+        assert utils.compute_sha256(str(path)) == hashlib.sha256(data).hexdigest(), size
+
+
+class _FakePicamera2:
+    def __init__(self):
+        self.started = False
+    
+    def create_still_configuration(self, **kwargs):
+        return kwargs
+    
+    def configure(self, config):
+        pass
+    
+    def start(self):
+        self.started = True
+    
+    def stop(self):
+        self.started = False
+
+
+class _FakeStreamBackend:
+    """Just enough of the picamera2 backend for CaptureStream; camera 1 fails to open."""
+    
+    def __init__(self):
+        self.cameras = {0: _FakePicamera2()}
+        self._last_configs = {}
+        self._format_mode = {}
+    
+    def _get_camera_lock(self, index):
+        return threading.Lock()
+    
+    def _get_camera(self, index):
+        if index not in self.cameras:
+            raise RuntimeError(f"camera {index} unavailable")
+        return self.cameras[index]
+    
+    def _config_to_picamera2_controls(self, config):
+        return {}
+
+
+def test_capture_stream_stops_started_cameras_on_failure(monkeypatch):
+    """If a later camera fails to start, the ones already started are stopped."""
+    from capture import stream
+    from capture.camera import CameraConfig
+    
+    backend = _FakeStreamBackend()
+    monkeypatch.setattr(stream, "get_backend", lambda: backend)
+    
+    with pytest.raises(RuntimeError, match="camera 1 unavailable"):
+        stream.CaptureStream([CameraConfig(camera_index=0), CameraConfig(camera_index=1)])
+    assert backend.cameras[0].started is False
+
+
+# Stand-in for "rpicam-still -t 0 --signal": on each SIGUSR1 it writes the
+# DNG and then the JPEG of the next numbered frame, like --raw does
+_FAKE_SIGNAL_DAEMON = '''\
+import signal, sys, time
+argv = sys.argv[1:]
+pattern = argv[argv.index("-o") + 1]
+count = 0
+def shoot(signum, frame):
+    global count
+    path = pattern % count
+    if "--raw" in argv:
+        with open(path.rsplit(".", 1)[0] + ".dng", "wb") as f:
+            f.write(b"DNG%d" % count)
+    with open(path, "wb") as f:
+        f.write(b"\\xff\\xd8JPEG%d\\xff\\xd9" % count)
+    count += 1
+signal.signal(signal.SIGUSR1, shoot)
+while True:
+    time.sleep(1)
+'''
+
+
+def test_rpicam_signal_backend_takes_each_numbered_frame(tmp_path, monkeypatch):
+    """Each capture gets its own frame, and the raw sibling never lingers in the spool."""
+    import stat
+    import sys
+    from capture.backends import subprocess_backend
+    from capture.camera import CameraConfig
+    
+    daemon = tmp_path / "rpicam-still"
+    daemon.write_text(f"#!{sys.executable}\n" + _FAKE_SIGNAL_DAEMON)
+    daemon.chmod(daemon.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(subprocess_backend, "_rpicam_still", lambda: str(daemon))
+    monkeypatch.setattr(subprocess_backend.RpicamSignalBackend, "STARTUP_DELAY", 0.5)
+    
+    backend = subprocess_backend.RpicamSignalBackend(logging.getLogger("test_capture"))
+    config = CameraConfig(camera_index=0, raw=True)
+    try:
+        for n in range(3):
+            output = tmp_path / f"out{n}.jpg"
+            backend.capture_image(output, config)
+            assert output.read_bytes() == b"\xff\xd8JPEG%d\xff\xd9" % n
+            assert output.with_suffix(".dng").read_bytes() == b"DNG%d" % n
+            _, _, spool_dir = backend._daemons[0]
+            assert not any(spool_dir.iterdir())
+    finally:
+        backend.cleanup()
+
+
+def test_failed_stagger_calibration_is_stored(tmp_path, monkeypatch):
+    """A pair where every candidate fails stores the default instead of retrying each start."""
+    from capture import service
+    from capture.camera import CameraConfig
+    
+    from capture.backends.base import CameraBackend
+    
+    class FailingBackend:
+        capture_images = CameraBackend.capture_images
+        
+        def get_backend_name(self):
+            return "failing"
+        
+        def capture_image(self, output_path, camera_config):
+            raise RuntimeError("camera timed out")
+    
+    monkeypatch.setattr(service, "STAGGER_CALIBRATION_FILE", tmp_path / "stagger_calibration.json")
+    monkeypatch.setattr(service, "_stagger_cache", {})
+    monkeypatch.setattr(service, "get_backend", FailingBackend)
+    cam0, cam1 = CameraConfig(camera_index=0), CameraConfig(camera_index=1)
+    
+    assert service.calibrate_stagger(cam0, cam1, candidates=(0, 5), iterations=1) == service.DEFAULT_STAGGER_MS
+    assert '"failing:0-1": %d' % service.DEFAULT_STAGGER_MS in (tmp_path / "stagger_calibration.json").read_text()
+    
+    # Stored, so the next start doesn't sweep the pair again
+    monkeypatch.setattr(service, "_stagger_cache", {})
+    monkeypatch.setattr(service, "calibrate_stagger", lambda a, b: pytest.fail("recalibrated"))
+    service.calibrate_missing_staggers(cam0, cam1)
+
+
+def test_stagger_calibration_uses_the_batch_capture_path(tmp_path, monkeypatch):
+    """Calibration launches cameras exactly like capture_batch: through capture_images when native."""
+    from capture import service
+    from capture.backends.base import CameraBackend
+    from capture.camera import CameraConfig
+    
+    calls = []
+    
+    class BatchingBackend:
+        def get_backend_name(self):
+            return "batching"
+        
+        def capture_image(self, output_path, camera_config):
+            pytest.fail("captured outside capture_images")
+        
+        def capture_images(self, jobs, stagger_ms=0):
+            calls.append(([config.camera_index for _, config in jobs], stagger_ms))
+            return [(str(path), 0.25 * (i + 1)) for i, (path, _) in enumerate(jobs)]
+    
+    assert BatchingBackend.capture_images is not CameraBackend.capture_images
+    monkeypatch.setattr(service, "STAGGER_CALIBRATION_FILE", tmp_path / "stagger_calibration.json")
+    monkeypatch.setattr(service, "_stagger_cache", {})
+    monkeypatch.setattr(service, "get_backend", BatchingBackend)
+    cam0, cam1 = CameraConfig(camera_index=0), CameraConfig(camera_index=1)
+    
+    assert service.calibrate_stagger(cam0, cam1, candidates=(5, 10), iterations=2) == 5
+    assert calls == [([0, 1], 5), ([0, 1], 5)]
+    
+    # The backend's own per-camera times are used as is
+    results = service._capture_jobs(BatchingBackend(), [(tmp_path / "a.jpg", cam0), (tmp_path / "b.jpg", cam1)], 5)
+    assert [elapsed for _, elapsed, _ in results] == [0.25, 0.5]
+
+
+def test_rpicam_capture_images_times_each_camera(tmp_path, monkeypatch):
+    """Per-job durations come from each child's own exit, not from the whole batch."""
+    import stat
+    import sys
+    from capture.backends import subprocess_backend
+    from capture.camera import CameraConfig
+    
+    if not subprocess_backend._USE_POSIX_SPAWN:
+        pytest.skip("capture_images falls back to threads without posix_spawn")
+    
+    # Camera 1 takes 0.4 s longer than camera 0
+    fake = tmp_path / "rpicam-still"
+    fake.write_text(
+        f"#!{sys.executable}\n"
+        "import sys, time\n"
+        "argv = sys.argv[1:]\n"
+        "time.sleep(0.4 * int(argv[argv.index('--camera') + 1]))\n"
+    )
+    fake.chmod(fake.stat().st_mode | stat.S_IEXEC)
+    monkeypatch.setattr(subprocess_backend, "_rpicam_still", lambda: str(fake))
+    
+    backend = subprocess_backend.RpicamBackend(logging.getLogger("test_capture"))
+    jobs = [(tmp_path / "c0.jpg", CameraConfig(camera_index=0)), (tmp_path / "c1.jpg", CameraConfig(camera_index=1))]
+    (path0, time0), (path1, time1) = backend.capture_images(jobs, stagger_ms=50)
+    
+    assert (path0, path1) == (str(tmp_path / "c0.jpg"), str(tmp_path / "c1.jpg"))
+    assert time1 >= 0.4
+    assert time0 < time1 - 0.2
@@ -14,25 +14,53 @@ Usage: python tests/validate_system.py
 """
 
 import sys
+
+# A quick check shouldn't write .pyc files for everything it imports (slow
+# on the Pi's SD card); existing bytecode caches are still used
+sys.dont_write_bytecode = True
+
+import importlib
 from pathlib import Path
 
+# Modules imported by the validators, so each module is looked up once per
+# run however many validators need it.
+_IMPORT_CACHE: dict = {}
+
+
+def _cached_import(name):
+    """Import module *name*, reusing the result of earlier calls."""
+    module = _IMPORT_CACHE.get(name)
+    if module is None:
+        module = _IMPORT_CACHE[name] = importlib.import_module(name)
+    return module
+
+
+# module -> names it must provide
+REQUIRED_IMPORTS = {
+    "app.core.config": ["settings"],
+    "app.core.db": ["engine", "Base", "SessionLocal"],
+    "app.models.project": ["Project"],
+    "app.models.document": ["DocumentImage", "ExifData"],
+    "app.models.camera": ["CameraSettings"],
+    "app.models.user": ["User"],
+    "app.api.cameras": ["CaptureRequest", "CaptureResponse", "DualCaptureRequest"],
+    "app.schemas.document": ["DocumentRead"],
+    "app.schemas.camera": ["CameraSettingsRead"],
+    "capture.service": ["single_capture_image", "dual_capture_image", "is_camera_connected"],
+    "capture.camera": ["CameraConfig", "IMG_SIZES"],
+    "PIL.Image": [],
+    "PIL.ExifTags": ["TAGS"],
+}
+
 def validate_imports():
     """Validate all required imports work."""
     print("[1/6] Validating imports...", end=" ")
     try:
-        from app.core.config import settings
-        from app.core.db import engine, Base, SessionLocal
-        from app.models.project import Project
-        from app.models.document import DocumentImage, ExifData
-        from app.models.camera import CameraSettings
-        from app.models.user import User
-        from app.api.cameras import CaptureRequest, CaptureResponse, DualCaptureRequest
-        from app.schemas.document import DocumentRead
-        from app.schemas.camera import CameraSettingsRead
-        from capture.service import single_capture_image, dual_capture_image, is_camera_connected
-        from capture.camera import CameraConfig, IMG_SIZES
-        from PIL import Image
-        from PIL.ExifTags import TAGS
+        for module_name, names in REQUIRED_IMPORTS.items():
+            module = _cached_import(module_name)
+            for name in names:
+                if not hasattr(module, name):
+                    raise ImportError(f"cannot import name '{name}' from '{module_name}'")
         print("[OK]")
         return True
     except Exception as e:
@@ -43,7 +71,7 @@ def validate_config():
     """Validate configuration."""
     print("[2/6] Validating configuration...", end=" ")
     try:
-        from app.core.config import settings
+        settings = _cached_import("app.core.config").settings
         assert settings.DATABASE_URL, "DATABASE_URL not set"
         assert settings.projects_dir, "projects_dir not set"
         assert settings.data_dir, "data_dir not set"
@@ -57,10 +85,8 @@ def validate_database():
     """Validate database schema."""
     print("[3/6] Validating database schema...", end=" ")
     try:
-        from app.core.db import engine
         from sqlalchemy import inspect
-        inspector = inspect(engine)
-        tables = inspector.get_table_names()
+        tables = frozenset(inspect(_cached_import("app.core.db").engine).get_table_names())
         
         required = ["projects", "document_images", "camera_settings", "exif_data"]
         for table in required:
@@ -73,24 +99,25 @@ def validate_database():
         print(f"[FAIL] {e}")
         return False
 
+REQUIRED_ROUTES = frozenset((
+    "/cameras/capture",
+    "/cameras/capture/dual",
+    "/cameras/devices",
+    "/projects/",
+    "/documents/",
+))
+
 def validate_api():
     """Validate API endpoints."""
     print("[4/6] Validating API endpoints...", end=" ")
     try:
-        from app.main import app
+        app = _cached_import("app.main").app
         
-        routes = {r.path for r in app.routes if hasattr(r, 'path')}
-        required = [
-            "/cameras/capture",
-            "/cameras/capture/dual",
-            "/cameras/devices",
-            "/projects/",
-            "/documents/",
-        ]
+        routes = app.state.path_index
         
-        for route in required:
-            if not any(route in r for r in routes):
-                raise ValueError(f"Route '{route}' not found")
+        if not REQUIRED_ROUTES <= routes:
+            missing = "', '".join(sorted(REQUIRED_ROUTES - routes))
+            raise ValueError(f"Route '{missing}' not found")
         
         print(f"[OK] ({len(routes)} endpoints)")
         return True
@@ -102,9 +129,9 @@ def validate_models():
     """Validate model definitions."""
     print("[5/6] Validating models...", end=" ")
     try:
-        from app.models.document import DocumentImage
-        from app.models.camera import CameraSettings
-        from app.models.project import Project
+        DocumentImage = _cached_import("app.models.document").DocumentImage
+        CameraSettings = _cached_import("app.models.camera").CameraSettings
+        Project = _cached_import("app.models.project").Project
         
         # Verify models can be instantiated
         proj = Project(name="test", description="test")
@@ -121,7 +148,7 @@ def validate_capture_service():
     """Validate capture service."""
     print("[6/6] Validating capture service...", end=" ")
     try:
-        from capture.camera import CameraConfig, IMG_SIZES
+        IMG_SIZES = _cached_import("capture.camera").IMG_SIZES
         
         # Verify presets
         assert len(IMG_SIZES) == 3, f"Expected 3 IMG_SIZES, got {len(IMG_SIZES)}"
@@ -142,10 +169,6 @@ def validate_capture_service():
 
 
 def main():
-    print("\n" + "="*70)
-    print("DIGITIZATION TOOLKIT - SYSTEM VALIDATION")
-    print("="*70 + "\n")
-    
     tests = [
         validate_imports,
         validate_config,
@@ -155,32 +178,40 @@ def main():
         validate_capture_service,
     ]
     
-    results = [test() for test in tests]
-    
     print("\n" + "="*70)
+    print("DIGITIZATION TOOLKIT - SYSTEM VALIDATION")
+    print("="*70 + "\n")
+    
+    results = [test() for test in tests]
     passed = sum(results)
     total = len(results)
     
+    # The summary is assembled here and written in one go at the end
+    messages = [
+        "",
+        "="*70,
+    ]
     if passed == total:
-        print(f"SUCCESS: All {total} validation tests passed!")
-        print("\nSystem is ready for deployment:")
-        print("  * Configuration: OK")
-        print("  * Database: OK")
-        print("  * API: OK")
-        print("  * Models: OK")
-        print("  * Capture service: OK")
-        print("\nNext steps:")
-        print("  1. Apply database migrations: alembic upgrade head")
-        print("  2. Start API server: uvicorn app.main:app --reload")
-        print("  3. Create project: POST /projects/")
-        print("  4. Initialize project: POST /projects/{id}/initialize")
-        print("  5. Capture images: POST /cameras/capture")
-        print("="*70)
-        return 0
+        messages += [
+            f"SUCCESS: All {total} validation tests passed!",
+            "\nSystem is ready for deployment:",
+            "  * Configuration: OK",
+            "  * Database: OK",
+            "  * API: OK",
+            "  * Models: OK",
+            "  * Capture service: OK",
+            "\nNext steps:",
+            "  1. Apply database migrations: alembic upgrade head",
+            "  2. Start API server: uvicorn app.main:app --reload",
+            "  3. Create project: POST /projects/",
+            "  4. Initialize project: POST /projects/{id}/initialize",
+            "  5. Capture images: POST /cameras/capture",
+        ]
     else:
-        print(f"FAILED: {passed}/{total} tests passed")
-        print("="*70)
-        return 1
+        messages.append(f"FAILED: {passed}/{total} tests passed")
+    messages.append("="*70)
+    sys.stdout.write("\n".join(messages) + "\n")
+    return 0 if passed == total else 1
 
 
 if __name__ == "__main__":